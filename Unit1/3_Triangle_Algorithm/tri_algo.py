@@ -8,9 +8,7 @@ class Cowboy_Lin_Alg(object):
 		n = len(Utri) # row dimension of the Utri matrix
 		x = np.zeros_like(b, dtype=float)
 		for i in range(n - 1, -1, -1):	# loop to iterate through row index
-			x[i] += b[i] / Utri[i,i]
-			for j in range(n-1, i, -1):	# loop to iterate through the off diagonal Sum part
-				x[i] += (- (Utri[i, j] * x[j])) / Utri[i,i]
+			x[i] = (b[i] - np.dot(Utri[i, i+1:], x[i+1:])) / Utri[i,i]	# off diagonal Sum part as one dot product
 		return x
 		
 			
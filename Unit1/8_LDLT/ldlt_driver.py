@@ -16,4 +16,4 @@ if __name__ == "__main__":
 	print("D:")
 	print(D)
 	print("Check:")
-	print((A - np.dot(np.dot(L, D), L.T)).round())
+	print((A - np.dot(L * D, L.T)).round())	# D comes back as the 1-D diagonal
@@ -2,19 +2,10 @@
 # By: Nick Space Cowboy
 
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
+from lin_alg.fitting import linefit
 
-def linefit(x_data, y_data):
-	b = np.array(y_data)
-	A = np.ones((len(b), 2))
-	A[:,1] = np.array(x_data)
-	lsq = lsq = np.linalg.lstsq(A, b.T, rcond=None)
-	x = lsq[0]
-	norm = lsq[1][0]**(0.5)
-	return [x, norm]
-	
 def plot(din, line_params, title, filename):
+	import matplotlib.pyplot as plt
 	plt.style.use("dark_background")
 	fig, ax = plt.subplots(sharey=True)
 	ax.set_ylabel("Time (s)")
@@ -31,6 +22,7 @@ def plot(din, line_params, title, filename):
 	plt.savefig(f"{filename}.jpg", format="jpg")
 	
 if __name__ == "__main__":
+	import pandas as pd
 	data = pd.read_csv("std-rust_test_100000.0.csv")
 	fit = linefit(data["Total Numbers"], data["Runtime"])
 	print(f"Slope: {fit[0][1]}")
@@ -0,0 +1,24 @@
+# Computational Linear Algebra - Online Line-Fitting
+# By: Nick Space Cowboy
+
+import numpy as np
+from lin_alg.fitting import OnlineFit
+
+if __name__ == "__main__":
+	# long stream of noisy samples of y = 1 + 2x, older samples forgotten
+	m = 20000
+	x = np.random.rand(m)
+	y = 1 + 2 * x + np.random.normal(0, 0.1, m)
+	for forget in [0.9, 0.95, 0.99, 1.0]:
+		fit = OnlineFit("line", forget=forget)
+		for i in range(0, m):
+			fit.add(x[i], y[i])
+		coeffs, norm = fit.fit()
+		# same fit in one go, each row weighted by forget^age
+		w = np.sqrt(forget ** np.arange(m - 1, -1, -1))
+		A = np.ones((m, 2))
+		A[:,1] = x
+		lsq = np.linalg.lstsq(A * w[:,None], y * w, rcond=None)
+		print(f"forget {forget}: C0 {coeffs[0]} C1 {coeffs[1]} Norm: {norm}")
+		print("Check:")
+		print(coeffs - lsq[0], norm - lsq[1][0] ** (0.5))
@@ -2,26 +2,10 @@
 # By: Nick Space Cowboy
 
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
+from lin_alg.fitting import polyfit_orders
 
-def polyfit(x_data, y_data, order):
-    aorder = order + 1
-    b = np.array(y_data)
-    A = np.ones((len(b), aorder))
-    for i in range(1, aorder):
-        A[:,i] = np.array(x_data) ** i
-    lsq = np.linalg.lstsq(A, b.T, rcond=None)
-    x = lsq[0]
-    try: 
-        norm = lsq[1][0]**(0.5)
-        return [x, norm]
-    except IndexError:
-        print("WARNING: Potential Overfit")
-        mnorm = sum((np.dot(A, x) - b) ** 2) ** (0.5)
-        return [x, mnorm]
-    
 def plot(din, line_params, title, filename):
+    import matplotlib.pyplot as plt
     plt.style.use("dark_background")
     fig, ax = plt.subplots(sharey=True)
     ax.set_ylabel("Time (s)")
@@ -41,10 +25,13 @@ def plot(din, line_params, title, filename):
     plt.savefig(f"{filename}.jpg", format="jpg")
     
 if __name__ == "__main__":
+    import pandas as pd
     data = pd.read_csv("std-rust_test_100000.0.csv")
+    # every order comes out of a single QR of the 4th order design matrix
+    fits = polyfit_orders(data["Total Numbers"], data["Runtime"], 4)
     for i in range(1, 5):
         print(f"{i} order polynomial fit")
-        fit = polyfit(data["Total Numbers"], data["Runtime"], i)
+        fit = fits[i - 1]
         c = 0
         for j in fit[0]:
             print(f"C{c}: {j}")
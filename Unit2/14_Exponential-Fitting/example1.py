@@ -2,22 +2,13 @@
 # By: Nick Space Cowboy
 
 import numpy as np
-import matplotlib.pyplot as plt
+from lin_alg.fitting import expfit
 
-def expfit(x_data, y_data):
-    b = np.log(y_data)
-    A = np.ones((len(b), 2))
-    A[:,1] = np.array(x_data)
-    lsq = np.linalg.lstsq(A, b.T, rcond=None)
-    x = lsq[0]
-    x[0] = np.exp(x[0])
-    norm = lsq[1][0]**(0.5)
-    return [x, norm]
-        
 def exponent(x, const, alpha):
     return const * np.exp(alpha * x)
     
 def plot(data, params, title):
+    import matplotlib.pyplot as plt
     plt.style.use("dark_background")
     fig, ax = plt.subplots(sharey=True)
     ax.set_ylabel(r"$f(x)$")
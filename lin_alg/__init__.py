@@ -0,0 +1,42 @@
+'''
+Cowboy Linear Algebra python library
+By: Nick the Space Cowboy
+
+Submodules are only imported the first time one of their names is used,
+so `import lin_alg` stays cheap for short lived processes.
+'''
+import importlib
+
+_exports = {
+	"triangular": ["PackedMatrix", "pack", "unpack", "back_sub", "forward_sub"],
+	"lu": ["SGE", "LU", "LUFactor", "refine_solve", "LDV"],
+	"errors": ["NotPosDefError"],
+	"cholesky": ["pos_def_check", "cholesky", "cholesky_solve", "LDLT", "LDLTFactor"],
+	"banded": ["bandwidth", "to_band", "from_band", "band_LU", "band_LU_solve",
+				"band_cholesky", "band_cholesky_solve", "thomas", "solve"],
+	"sparse": ["CSRMatrix", "to_csr", "RCM", "permute", "SparseSymbolic", "analyze",
+				"SparseFactor"],
+	"batched": ["batch_forward_sub", "batch_back_sub", "batch_LU", "batch_LU_solve",
+				"batch_cholesky", "batch_LDLT"],
+	"lstsq": ["least_squares", "QRFactor", "LeastSquaresAccumulator", "stream_least_squares"],
+	"parallel": ["solve_all"],
+	"krylov": ["cg", "gmres", "jacobi", "ichol", "ilu"],
+	"orthogonal": ["gram_schmidt"],
+	"determinants": ["bareiss"],
+	"fitting": ["linefit", "polyfit", "expfit", "stream_polyfit", "OnlineFit", "vandermonde",
+				"polyval", "polyfit_orders", "batch_linefit", "batch_polyfit", "batch_expfit",
+				"group_series", "robust_fit"],
+	"backend": ["set_backend", "get_backend"],
+}
+_where = {name: module for module, names in _exports.items() for name in names}
+__all__ = sorted(_where)
+
+def __getattr__(name):
+	if name in _where:
+		value = getattr(importlib.import_module(f".{_where[name]}", __name__), name)
+		globals()[name] = value
+		return value
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	
+def __dir__():
+	return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,43 @@
+# Cowboy Linear Algebra python library - compute backend selection
+# By: Nick the Space Cowboy
+
+import os
+import warnings
+
+BACKENDS = ("numpy", "numba")
+_backend = None
+
+def set_backend(name):
+	'''
+	Selects the backend the kernels run on ("numpy" or "numba")
+	numba is only imported here, when it is asked for. Without numba
+	installed the numpy (pure python) kernels stay in use.
+	'''
+	global _backend
+	if name not in BACKENDS:
+		raise Exception (f"Unknown backend {name}")
+	if name == "numba":
+		try:
+			import numba
+		except ImportError:
+			warnings.warn("numba is not installed, using the numpy backend")
+			name = "numpy"
+	_backend = name
+	
+def get_backend():
+	'''
+	Current backend, taken from $LIN_ALG_BACKEND (default "numpy") on first use
+	'''
+	if _backend is None:
+		set_backend(os.environ.get("LIN_ALG_BACKEND", "numpy"))
+	return _backend
+	
+def jit_kernel(name):
+	'''
+	Compiled kernel `name` from lin_alg.kernels under the numba backend,
+	None under the numpy backend
+	'''
+	if get_backend() != "numba":
+		return None
+	from . import kernels
+	return getattr(kernels, name)
@@ -0,0 +1,196 @@
+# Cowboy Linear Algebra python library - banded and tridiagonal solvers
+# By: Nick the Space Cowboy
+
+import numpy as np
+from .errors import NotPosDefError
+from .lu import LUFactor
+
+def bandwidth(A):
+	'''
+	Lower and upper bandwidths (kl, ku) of A from its nonzero entries
+	'''
+	i, j = np.nonzero(A)
+	if len(i) == 0:
+		return 0, 0
+	return max(np.max(i - j), 0), max(np.max(j - i), 0)
+	
+def to_band(A, kl, ku):
+	'''
+	Compact band storage (LAPACK layout): ab[ku + i - j, j] = A[i, j]
+	A (kl + ku + 1) x n array, (2*bw + 1) x n for a symmetric bandwidth bw
+	'''
+	n = len(A)
+	ab = np.zeros([kl + ku + 1, n], dtype=np.float64)
+	for k in range(-ku, kl + 1):	# one diagonal at a time
+		d = np.diagonal(A, -k)
+		if k >= 0:
+			ab[ku + k, :n - k] = d
+		else:
+			ab[ku + k, -k:] = d
+	return ab
+	
+def from_band(ab, kl, ku):
+	'''
+	Dense array from compact band storage
+	'''
+	n = ab.shape[1]
+	A = np.zeros([n, n], dtype=np.float64)
+	for k in range(-ku, kl + 1):
+		if k >= 0:
+			A[np.arange(k, n), np.arange(0, n - k)] = ab[ku + k, :n - k]
+		else:
+			A[np.arange(0, n + k), np.arange(-k, n)] = ab[ku + k, -k:]
+	return A
+	
+def band_LU(ab, kl, ku, overwrite_ab=False):
+	'''
+	LU decomposition in compact band storage (no pivoting, like SGE)
+	U stays in rows 0..ku of ab and the multipliers of L take the place of
+	the entries below the diagonal, so each step only touches a
+	(kl + 1) x (ku + 1) window instead of the whole trailing matrix.
+	'''
+	F = ab if overwrite_ab else np.array(ab, dtype=np.float64)
+	n = F.shape[1]
+	for k in range(0, n):
+		if F[ku, k] == 0:
+			raise Exception ("Zero pivot in band LU")
+		nr = min(kl, n - 1 - k)
+		nc = min(ku, n - 1 - k)
+		F[ku+1:ku+1+nr, k] *= 1.0 / F[ku, k]
+		if nr and nc:
+			i = np.arange(k + 1, k + 1 + nr)[:, None]
+			j = np.arange(k + 1, k + 1 + nc)[None, :]
+			F[ku + i - j, j] -= np.multiply.outer(F[ku+1:ku+1+nr, k], F[ku + k - j[0], j[0]])
+	return F
+	
+def band_LU_solve(F, kl, ku, c):
+	'''
+	Solves with the factors from band_LU
+	'''
+	x = np.array(c, dtype=np.float64)
+	if x.ndim == 1:
+		x = x.reshape(-1, 1)
+	n = F.shape[1]
+	for k in range(0, n):	# forward sweep with unit L
+		nr = min(kl, n - 1 - k)
+		x[k+1:k+1+nr] -= np.multiply.outer(F[ku+1:ku+1+nr, k], x[k])
+	rdiag = 1.0 / F[ku]
+	for i in range(n - 1, -1, -1):	# back sweep with U
+		j = np.arange(i + 1, i + 1 + min(ku, n - 1 - i))
+		x[i] = (x[i] - np.dot(F[ku + i - j, j], x[j])) * rdiag[i]
+	return x
+	
+def band_cholesky(ab, overwrite_ab=False):
+	'''
+	Cholesky decomposition of a symmetric band matrix in lower band storage,
+	ab[i - j, j] = A[i, j] for i >= j (which is to_band(A, kd, 0))
+	Non-positive pivots raise NotPosDefError like cholesky.
+	'''
+	F = ab if overwrite_ab else np.array(ab, dtype=np.float64)
+	kd = len(F) - 1
+	n = F.shape[1]
+	for k in range(0, n):
+		if not F[0, k] > 0:
+			raise NotPosDefError(k)
+		F[0, k] = np.sqrt(F[0, k])
+		nr = min(kd, n - 1 - k)
+		F[1:1+nr, k] *= 1.0 / F[0, k]
+		if nr:
+			# update the lower triangle of the (nr x nr) trailing window
+			i, j = np.tril_indices(nr)
+			F[i - j, k + 1 + j] -= F[1 + i, k] * F[1 + j, k]
+	return F
+	
+def band_cholesky_solve(F, c):
+	'''
+	Solves with the factor from band_cholesky
+	'''
+	x = np.array(c, dtype=np.float64)
+	if x.ndim == 1:
+		x = x.reshape(-1, 1)
+	kd = len(F) - 1
+	n = F.shape[1]
+	for k in range(0, n):
+		nr = min(kd, n - 1 - k)
+		x[k] *= 1.0 / F[0, k]
+		x[k+1:k+1+nr] -= np.multiply.outer(F[1:1+nr, k], x[k])
+	for i in range(n - 1, -1, -1):
+		nr = min(kd, n - 1 - i)
+		x[i] = (x[i] - np.dot(F[1:1+nr, i], x[i+1:i+1+nr])) / F[0, i]
+	return x
+	
+def thomas(a, b, c, d):
+	'''
+	Thomas algorithm for a tridiagonal system
+	a is the sub diagonal, b the diagonal and c the super diagonal (a and c
+	have n - 1 entries). d may be a vector or an (n, k) block. Runs in O(n)
+	without ever forming the n x n matrix.
+	'''
+	n = len(b)
+	x = np.array(d, dtype=np.float64)
+	if x.ndim == 1:
+		x = x.reshape(-1, 1)
+	# the recurrences run on python floats, numpy scalar indexing costs more
+	a = np.asarray(a, dtype=np.float64).tolist()
+	b = np.asarray(b, dtype=np.float64).tolist()
+	c = np.asarray(c, dtype=np.float64).tolist()
+	cp = [0.0] * n
+	rw = [0.0] * n	# reciprocal pivots
+	for i in range(0, n):
+		w = b[i] - a[i-1] * cp[i-1] if i > 0 else b[0]
+		if w == 0:
+			raise Exception ("Zero pivot in tridiagonal solve")
+		rw[i] = 1.0 / w
+		if i < n - 1:
+			cp[i] = c[i] * rw[i]
+	if x.shape[1] > 1:
+		for i in range(0, n):
+			if i > 0:
+				x[i] -= a[i-1] * x[i-1]
+			x[i] *= rw[i]
+		for i in range(n - 2, -1, -1):
+			x[i] -= cp[i] * x[i+1]
+		return x
+	y = x[:, 0].tolist()
+	y[0] *= rw[0]
+	for i in range(1, n):
+		y[i] = (y[i] - a[i-1] * y[i-1]) * rw[i]
+	for i in range(n - 2, -1, -1):
+		y[i] -= cp[i] * y[i+1]
+	x[:, 0] = y
+	return x
+	
+def _diag_dominant(A):
+	'''
+	True when A is diagonally dominant by rows or by columns, which is what
+	keeps the unpivoted band eliminations stable
+	'''
+	M = np.abs(A)
+	d = 2 * np.diagonal(M)
+	return np.all(np.sum(M, axis=1) <= d) or np.all(np.sum(M, axis=0) <= d)
+	
+def solve(A, b):
+	'''
+	Solves Ax = b, picking the solver from the bandwidth of A
+	Narrow symmetric positive definite bands go to band_cholesky. Narrow
+	diagonally dominant bands go to thomas (tridiagonal) or band_LU, which do
+	not pivot, and everything else to the pivoted LU.
+	'''
+	n = len(A)
+	kl, ku = bandwidth(A)
+	tridiagonal = kl <= 1 and ku <= 1 and n > 1
+	if not tridiagonal and kl + ku + 1 > n // 4:
+		return LUFactor(A).solve(b)
+	if kl == ku and np.array_equal(A, np.transpose(A)):
+		try:
+			return band_cholesky_solve(band_cholesky(to_band(A, kl, 0)), b)
+		except NotPosDefError:
+			pass
+	if _diag_dominant(A):
+		try:
+			if tridiagonal:
+				return thomas(np.diagonal(A, -1), np.diagonal(A), np.diagonal(A, 1), b)
+			return band_LU_solve(band_LU(to_band(A, kl, ku), kl, ku, True), kl, ku, b)
+		except Exception:
+			pass	# zero pivot, only weakly dominant
+	return LUFactor(A).solve(b)
@@ -0,0 +1,119 @@
+# Cowboy Linear Algebra python library - batched small matrix factorizations
+# By: Nick the Space Cowboy
+
+import numpy as np
+
+def _batch_rhs(B):
+	'''
+	(N, n, k) float64 copy of a batch of right-hand sides given as (N, n) or (N, n, k)
+	'''
+	X = np.array(B, dtype=np.float64)
+	return X[:, :, None] if X.ndim == 2 else X
+	
+def batch_forward_sub(L, B, unit_diagonal=False):
+	'''
+	forward substitution for a stack of lower triangular systems
+	L is (N, n, n), B is (N, n) or (N, n, k); every row step runs across the
+	whole batch at once. Returns x with the shape of B; members with a zero
+	on the diagonal come out as inf/nan instead of raising.
+	'''
+	X = _batch_rhs(B)
+	n = L.shape[1]
+	with np.errstate(divide="ignore", invalid="ignore"):	# singular members give inf/nan, not an error
+		for i in range(0, n):
+			X[:, i] -= np.einsum("bj,bjk->bk", L[:, i, :i], X[:, :i])
+			if not unit_diagonal:
+				X[:, i] /= L[:, i, i, None]
+	return X.reshape(np.shape(B))
+	
+def batch_back_sub(U, B, unit_diagonal=False):
+	'''
+	back substitution for a stack of upper triangular systems
+	U is (N, n, n), B is (N, n) or (N, n, k). Returns x with the shape of B.
+	'''
+	X = _batch_rhs(B)
+	n = U.shape[1]
+	with np.errstate(divide="ignore", invalid="ignore"):
+		for i in range(n - 1, -1, -1):
+			X[:, i] -= np.einsum("bj,bjk->bk", U[:, i, i+1:], X[:, i+1:])
+			if not unit_diagonal:
+				X[:, i] /= U[:, i, i, None]
+	return X.reshape(np.shape(B))
+	
+def batch_LU(A):
+	'''
+	Partial pivoting LU of a stack of (N, n, n) matrices
+	Returns (F, perm, info) with each F[b] packed like LU(pivot=True) and
+	A[b][perm[b]] = L U. info[b] is -1 when member b factored and otherwise
+	the column where it hit a zero pivot (the rest of the batch is unaffected).
+	'''
+	F = np.array(A, dtype=np.float64)
+	N, n = F.shape[0], F.shape[1]
+	b = np.arange(N)
+	perm = np.tile(np.arange(n), (N, 1))
+	info = np.full(N, -1, dtype=np.int64)
+	for k in range(0, n):
+		p = k + np.argmax(np.abs(F[:, k:, k]), axis=1)
+		row = F[b, k].copy()
+		F[b, k] = F[b, p]
+		F[b, p] = row
+		pk = perm[b, k].copy()
+		perm[b, k] = perm[b, p]
+		perm[b, p] = pk
+		piv = F[:, k, k]
+		bad = piv == 0
+		info[bad & (info < 0)] = k
+		F[:, k+1:, k] /= np.where(bad, 1.0, piv)[:, None]
+		F[:, k+1:, k+1:] -= F[:, k+1:, k, None] * F[:, None, k, k+1:]
+	return F, perm, info
+	
+def batch_LU_solve(F, perm, B):
+	'''
+	Solves every system of the batch with the factors from batch_LU
+	'''
+	X = _batch_rhs(B)
+	X = X[np.arange(len(X))[:, None], perm]
+	X = batch_forward_sub(F, X, unit_diagonal=True)
+	return batch_back_sub(F, X).reshape(np.shape(B))
+	
+def batch_cholesky(A):
+	'''
+	Column oriented Cholesky of a stack of (N, n, n) matrices
+	Returns (L, info); info[b] is -1 when member b is positive definite and
+	otherwise the index of its first non-positive pivot.
+	'''
+	L = np.array(A, dtype=np.float64)
+	N, n = L.shape[0], L.shape[1]
+	info = np.full(N, -1, dtype=np.int64)
+	for j in range(0, n):
+		L[:, j:, j] -= np.einsum("bik,bk->bi", L[:, j:, :j], L[:, j, :j])
+		bad = ~(L[:, j, j] > 0)
+		info[bad & (info < 0)] = j
+		d = np.sqrt(np.where(bad, 1.0, L[:, j, j]))
+		L[:, j, j] = d
+		L[:, j+1:, j] /= d[:, None]
+	iu = np.triu_indices(n, 1)
+	L[:, iu[0], iu[1]] = 0
+	return L, info
+	
+def batch_LDLT(A):
+	'''
+	Square root free LDL^T (no pivoting) of a stack of (N, n, n) symmetric matrices
+	Returns (L, d, info) with d the (N, n) diagonals; info[b] is -1 when member
+	b factored and otherwise the index of its first zero pivot.
+	'''
+	L = np.array(A, dtype=np.float64)
+	N, n = L.shape[0], L.shape[1]
+	d = np.zeros([N, n], dtype=np.float64)
+	info = np.full(N, -1, dtype=np.int64)
+	for k in range(0, n):
+		d[:, k] = L[:, k, k]
+		bad = d[:, k] == 0
+		info[bad & (info < 0)] = k
+		l = L[:, k+1:, k] / np.where(bad, 1.0, d[:, k])[:, None]
+		L[:, k+1:, k+1:] -= l[:, :, None] * L[:, None, k+1:, k]
+		L[:, k+1:, k] = l
+	iu = np.triu_indices(n, 1)
+	L[:, iu[0], iu[1]] = 0
+	L[:, np.arange(n), np.arange(n)] = 1
+	return L, d, info
@@ -0,0 +1,240 @@
+# Cowboy Linear Algebra python library - Cholesky and LDL^T decompositions
+# By: Nick the Space Cowboy
+
+import numpy as np
+from .backend import jit_kernel
+from .errors import NotPosDefError
+from .lu import LUFactor
+from .sparse import CSRMatrix, SparseFactor
+from .triangular import PackedMatrix, back_sub, forward_sub
+
+def pos_def_check(A):
+	'''
+	Checks if a matrix is positive definate
+	Runs the Cholesky sweep on a copy, which stops at the first bad pivot
+	'''
+	cholesky(A)
+	return True
+	
+def _chol_columns(F, offset=0):
+	'''
+	Column oriented Cholesky of the lower triangle of the square view F, in place
+	Each column takes one matrix-vector product against the columns already done.
+	Raises NotPosDefError as soon as a pivot comes out non-positive.
+	'''
+	n = len(F)
+	for j in range(0, n):
+		F[j:, j] -= np.dot(F[j:, :j], F[j, :j])
+		if not F[j, j] > 0:	# also catches nan
+			raise NotPosDefError(offset + j)
+		F[j, j] = np.sqrt(F[j, j])
+		F[j+1:, j] *= 1.0 / F[j, j]
+	return F
+
+def _chol_packed(P, block_size):
+	'''
+	Left looking blocked Cholesky of a PackedMatrix, in place
+	Each column panel is unpacked, updated by the panels before it with one
+	matrix product each, factored densely and packed back.
+	'''
+	n = P.n
+	for k0 in range(0, n, block_size):
+		k1 = min(k0 + block_size, n)
+		w = k1 - k0
+		F = P.panel(k0, k1, k0)
+		for p0 in range(0, k0, block_size):
+			Lp = P.panel(p0, min(p0 + block_size, k0), k0)
+			F -= np.dot(Lp, Lp[:w].T)
+		_chol_columns(F[:w], k0)
+		if w < len(F):
+			F[w:] = forward_sub(F[:w], F[w:].T).T
+		P.set_panel(k0, k1, k0, F)
+	return P
+
+def cholesky(A, engine="column", block_size=64, overwrite_a=False, symbolic=None):
+	'''
+	Function to perform a Cholesky decompostion
+	Only the lower triangle of A is read. engine="blocked" factors block_size
+	columns at a time and updates the trailing matrix with one matrix product
+	per block. overwrite_a=True builds L in A's own memory (float64 A only).
+	A PackedMatrix A gives back a PackedMatrix L, factored block_size columns
+	at a time. A CSRMatrix A gives back a SparseFactor, reusing the pattern
+	analysis in symbolic when one is passed.
+	Positive definiteness is checked on each pivot during the sweep, a
+	NotPosDefError carries the index of the first one that fails.
+	'''
+	if isinstance(A, CSRMatrix):
+		return SparseFactor(A, symbolic, "cholesky")
+	if isinstance(A, PackedMatrix):
+		return _chol_packed(A if overwrite_a else A.copy(), block_size)
+	if overwrite_a and isinstance(A, np.ndarray) and A.dtype == np.float64:
+		L = A
+	else:
+		L = np.array(A, dtype=np.float64)
+	n = len(L)
+	if engine == "column":
+		kernel = jit_kernel("cholesky")
+		if kernel is not None and L.flags.c_contiguous:
+			j = kernel(L)
+			if j >= 0:
+				raise NotPosDefError(j)
+		else:
+			_chol_columns(L)
+	elif engine == "blocked":
+		for k0 in range(0, n, block_size):
+			k1 = min(k0 + block_size, n)
+			_chol_columns(L[k0:k1, k0:k1], k0)
+			if k1 < n:
+				# L21 = A21 L11^-T, then the trailing A22 -= L21 L21^T
+				L[k1:, k0:k1] = forward_sub(L[k0:k1, k0:k1], L[k1:, k0:k1].T).T
+				L[k1:, k1:] -= np.dot(L[k1:, k0:k1], L[k1:, k0:k1].T)
+	else:
+		raise Exception (f"Unknown Cholesky engine {engine}")
+	L[np.triu_indices(n, 1)] = 0
+	return L
+	
+def cholesky_solve(A, b, fallback=False):
+	'''
+	Solves Ax = b for symmetric positive definite A with L L^T x = b
+	When the Cholesky sweep finds a non-positive pivot, fallback=True (or
+	"ldlt") retries with the pivoted LDL^T and fallback="lu" with a pivoted LU
+	'''
+	try:
+		L = cholesky(A)
+	except NotPosDefError:
+		if fallback == "lu":
+			return LUFactor(A).solve(b)
+		elif fallback:
+			return LDLTFactor(A).solve(b)
+		raise
+	y = forward_sub(L, b)
+	return back_sub(L.T, y)
+	
+def _sym_swap(F, perm, p, q):
+	'''
+	Symmetric row and column interchange of p and q
+	'''
+	F[[p, q]] = F[[q, p]]
+	F[:, [p, q]] = F[:, [q, p]]
+	perm[[p, q]] = perm[[q, p]]
+	
+def _ldlt_sweep(F, pivot):
+	'''
+	Square root free LDL^T of the symmetric array F, in place
+	With pivot=True Bunch-Kaufman pivoting picks 1x1 or 2x2 pivots so that
+	indefinite matrices factor stably. L ends up below the diagonal of F.
+	Returns the diagonal d, the 2x2 block off diagonals e and the permutation.
+	'''
+	n = len(F)
+	d = np.zeros(n, dtype=np.float64)
+	e = np.zeros(max(n - 1, 0), dtype=np.float64)
+	perm = np.arange(n)
+	alpha = (1 + np.sqrt(17)) / 8
+	k = 0
+	while k < n:
+		s = 1
+		if pivot and k < n - 1:
+			col = np.abs(F[k+1:, k])
+			r = k + 1 + np.argmax(col)
+			lam = col[r - k - 1]
+			if abs(F[k, k]) < alpha * lam:
+				# largest off diagonal in row/column r of the trailing matrix
+				sigma = max(np.max(np.abs(F[k:r, r])), np.max(np.abs(F[r+1:, r]), initial=0))
+				if abs(F[k, k]) * sigma >= alpha * lam ** 2:
+					pass
+				elif abs(F[r, r]) >= alpha * sigma:
+					_sym_swap(F, perm, k, r)
+				else:
+					s = 2
+					_sym_swap(F, perm, k + 1, r)
+		if s == 1:
+			if F[k, k] == 0:
+				raise Exception ("Matrix is singular")
+			d[k] = F[k, k]
+			l = F[k+1:, k] * (1.0 / d[k])
+			F[k+1:, k+1:] -= np.multiply.outer(l, F[k+1:, k])
+			F[k+1:, k] = l
+		else:
+			E = F[k:k+2, k:k+2].copy()
+			d[k], d[k+1], e[k] = E[0, 0], E[1, 1], E[1, 0]
+			C = F[k+2:, k:k+2].copy()
+			Lblk = np.dot(C, np.linalg.inv(E))
+			F[k+2:, k+2:] -= np.dot(Lblk, C.T)
+			F[k+2:, k:k+2] = Lblk
+			F[k+1, k] = 0
+		k += s
+	return d, e, perm
+	
+def _ldlt_packed(P, block_size):
+	'''
+	Left looking blocked LDL^T (no pivoting) of a PackedMatrix, in place
+	'''
+	n = P.n
+	d = np.zeros(n, dtype=np.float64)
+	for k0 in range(0, n, block_size):
+		k1 = min(k0 + block_size, n)
+		w = k1 - k0
+		F = P.panel(k0, k1, k0)
+		for p0 in range(0, k0, block_size):
+			p1 = min(p0 + block_size, k0)
+			Lp = P.panel(p0, p1, k0)
+			F -= np.dot(Lp * d[p0:p1], Lp[:w].T)
+		d[k0:k1] = _ldlt_sweep(F[:w], False)[0]
+		F[np.diag_indices(w)] = 1
+		if w < len(F):
+			F[w:] = forward_sub(F[:w], F[w:].T, unit_diagonal=True).T / d[k0:k1]
+		P.set_panel(k0, k1, k0, F)
+	return P, d
+
+def LDLT(A, pivot=False, overwrite_a=False, block_size=64):
+	'''
+	Function to perform the LDL^T matrix decomposition
+	Computed directly (no Cholesky, no square roots) with D returned as a
+	1-D array of its diagonal. L is built in A's memory when overwrite_a=True.
+	pivot=True uses Bunch-Kaufman pivoting for symmetric indefinite A and
+	returns (L, d, e, perm): e holds the off diagonals of D's 2x2 blocks and
+	A[perm][:, perm] = L D L^T.
+	A PackedMatrix A (unpivoted only) gives back a packed unit lower L and d.
+	'''
+	if isinstance(A, PackedMatrix):
+		if pivot:
+			raise Exception ("Pivoted LDL^T is not available for packed storage")
+		return _ldlt_packed(A if overwrite_a else A.copy(), block_size)
+	if overwrite_a and isinstance(A, np.ndarray) and A.dtype == np.float64:
+		L = A
+	else:
+		L = np.array(A, dtype=np.float64)
+	d, e, perm = _ldlt_sweep(L, pivot)
+	n = len(L)
+	L[np.triu_indices(n, 1)] = 0
+	L[np.diag_indices(n)] = 1
+	if pivot:
+		return L, d, e, perm
+	return L, d
+	
+class LDLTFactor(object):
+	'''
+	Factor once / solve many Bunch-Kaufman LDL^T for symmetric indefinite A
+	'''
+	def __init__(self, A, overwrite_a=False):
+		self.L, self.d, self.e, self.perm = LDLT(A, pivot=True, overwrite_a=overwrite_a)
+		
+	def solve(self, b):
+		'''
+		Solves Ax = b with the cached factors
+		'''
+		c = np.array(b, dtype=np.float64)[self.perm]
+		z = forward_sub(self.L, c, unit_diagonal=True)
+		k = np.nonzero(self.e)[0]
+		one = np.ones(len(self.d), dtype=bool)
+		one[k] = one[k + 1] = False
+		w = np.zeros_like(z)
+		w[one] = z[one] / self.d[one, None]
+		# 2x2 blocks of D are solved in closed form
+		det = self.d[k] * self.d[k + 1] - self.e[k] ** 2
+		w[k] = (self.d[k + 1, None] * z[k] - self.e[k, None] * z[k + 1]) / det[:, None]
+		w[k + 1] = (self.d[k, None] * z[k + 1] - self.e[k, None] * z[k]) / det[:, None]
+		y = back_sub(self.L.T, w)
+		x = np.zeros_like(y)
+		x[self.perm] = y
+		return x
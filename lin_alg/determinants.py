@@ -0,0 +1,32 @@
+# Cowboy Linear Algebra python library - determinants
+# By: Nick the Space Cowboy
+
+import numpy as np
+from .backend import jit_kernel
+
+def bareiss(A):
+	'''
+	Determinant of an integer matrix with the fraction free Bareiss algorithm
+	Works on an int64 copy of A, so every intermediate value stays exact.
+	'''
+	m, n = np.shape(A)
+	if m != n:
+		raise TypeError("Matrix is not square")
+	A = np.array(A, dtype=np.int64)
+	kernel = jit_kernel("bareiss")
+	if kernel is not None:
+		return kernel(A)
+	sign = 1
+	prev = 1
+	for k in range(n - 1):
+		if A[k, k] == 0:
+			# swap in a row with a nonzero entry in this column
+			nonzero = np.nonzero(A[k+1:, k])[0]
+			if len(nonzero) == 0:
+				return 0
+			p = k + 1 + nonzero[0]
+			A[[k, p]] = A[[p, k]]
+			sign = -sign
+		A[k+1:, k+1:] = (A[k, k] * A[k+1:, k+1:] - np.outer(A[k+1:, k], A[k, k+1:])) // prev
+		prev = A[k, k]
+	return sign * A[n - 1, n - 1]
@@ -0,0 +1,15 @@
+# Cowboy Linear Algebra python library - exceptions
+# By: Nick the Space Cowboy
+
+class NotPosDefError(Exception):
+	'''
+	Raised by cholesky when a pivot is not positive
+	index is the row/column of the failing pivot
+	'''
+	def __init__(self, index):
+		self.index = index
+		super().__init__(f"Matrix is not positive definite (pivot {index})")
+		
+	def __reduce__(self):
+		# rebuild from the index, so the error survives a trip between processes
+		return (NotPosDefError, (self.index,))
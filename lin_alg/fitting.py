@@ -0,0 +1,400 @@
+# Cowboy Linear Algebra python library - data fitting
+# By: Nick the Space Cowboy
+
+import warnings
+import numpy as np
+from .cholesky import cholesky_solve
+from .lstsq import LeastSquaresAccumulator, QRFactor
+from .triangular import back_sub, forward_sub
+
+BASES = ("monomial", "scaled", "chebyshev", "legendre")
+
+def vandermonde(x_data, order, basis="monomial", domain=None):
+	'''
+	Design matrix of the polynomial basis up to order, one column per term
+	Each column comes from the previous one or two (powers cumulatively, the
+	other bases by their three term recurrence), never x ** i from scratch.
+	Every basis but "monomial" first maps domain (default [min x, max x]) onto
+	[-1, 1], which keeps the columns of a high order fit on large x from
+	becoming nearly parallel: "scaled" is monomials in the mapped variable,
+	"chebyshev" and "legendre" the orthogonal polynomials.
+	'''
+	if basis not in BASES:
+		raise Exception (f"Unknown polynomial basis {basis}")
+	t = np.asarray(x_data, dtype=np.float64)
+	if basis != "monomial":
+		lo, hi = domain if domain is not None else (np.min(t), np.max(t))
+		if hi == lo:
+			raise Exception ("Polynomial domain has zero width")
+		t = (2 * t - (lo + hi)) / (hi - lo)
+	A = np.empty((len(t), order + 1), order="F")
+	A[:,0] = 1
+	if order > 0:
+		A[:,1] = t
+	for i in range(2, order + 1):
+		if basis == "chebyshev":
+			A[:,i] = 2 * t * A[:,i-1] - A[:,i-2]
+		elif basis == "legendre":
+			A[:,i] = ((2 * i - 1) * t * A[:,i-1] - (i - 1) * A[:,i-2]) / i
+		else:
+			A[:,i] = t * A[:,i-1]
+	return A
+	
+def polyval(coeffs, x_data, basis="monomial", domain=None):
+	'''
+	Evaluates a polynomial fit, domain should be the one the fit used
+	(for a fit without one, the fit data's (min x, max x))
+	'''
+	if basis != "monomial" and domain is None:
+		raise Exception (f"Evaluating a {basis} fit needs its domain")
+	return np.dot(vandermonde(x_data, len(coeffs) - 1, basis, domain), coeffs)
+
+def linefit(x_data, y_data, weights=None):
+	'''
+	Least squares line y = C0 + C1 x
+	weights gives each sample's weight in the sum of squares
+	Returns [coefficients, (weighted) residual norm]
+	'''
+	b = np.array(y_data, dtype=np.float64)
+	A = np.ones((len(b), 2))
+	A[:,1] = np.array(x_data)
+	if weights is not None:
+		sw = np.sqrt(np.asarray(weights, dtype=np.float64))
+		A *= sw[:,None]
+		b *= sw
+	lsq = np.linalg.lstsq(A, b.T, rcond=None)
+	x = lsq[0]
+	try:
+		norm = lsq[1][0]**(0.5)
+	except IndexError:	# lstsq leaves it out for exactly determined or rank deficient fits
+		norm = sum((np.dot(A, x) - b) ** 2) ** (0.5)
+	return [x, norm]
+	
+def polyfit(x_data, y_data, order, basis="monomial", domain=None):
+	'''
+	Least squares polynomial y = C0 + C1 x + ... + Cn x^n
+	basis picks the terms (see vandermonde), the coefficients are then for
+	that basis over domain (default the data's [min x, max x]) and
+	polyval(coeffs, x, basis, domain) evaluates them.
+	Returns [coefficients, residual norm]
+	'''
+	b = np.array(y_data)
+	A = vandermonde(x_data, order, basis, domain)
+	lsq = np.linalg.lstsq(A, b.T, rcond=None)
+	x = lsq[0]
+	try:
+		norm = lsq[1][0]**(0.5)
+		return [x, norm]
+	except IndexError:
+		warnings.warn("Potential Overfit")
+		mnorm = sum((np.dot(A, x) - b) ** 2) ** (0.5)
+		return [x, mnorm]
+		
+def polyfit_orders(x_data, y_data, max_order, basis="monomial", domain=None):
+	'''
+	Polynomial fits of every order 1..max_order from one QR factorization
+	The order k design matrix is the first k+1 columns of the max_order one,
+	so its R and Q^T y are leading blocks of the same factors: each order is
+	just a back substitution, and its residual norm the tail of Q^T y.
+	Returns a list of [coefficients, residual norm], one per order
+	'''
+	qr = QRFactor(vandermonde(x_data, max_order, basis, domain), overwrite_a=True)
+	c = qr.apply_qt(y_data)[:,0]
+	fits = []
+	for p in range(2, max_order + 2):
+		x = back_sub(qr.F[:p, :p], c[:p])[:,0]
+		fits.append([x, np.linalg.norm(c[p:])])
+	return fits
+	
+def _log_data(x_data, y_data, weights):
+	'''
+	x, log(y) and weights for an exponential fit, dropping samples with y <= 0
+	weights="y" weights each sample by y^2, undoing the log's stretching of
+	small y (d log y = dy / y) so the fit matches a fit to y itself.
+	'''
+	x = np.asarray(x_data, dtype=np.float64)
+	y = np.asarray(y_data, dtype=np.float64)
+	keep = y > 0
+	if not np.all(keep):
+		warnings.warn(f"Dropped {np.sum(~keep)} samples with y <= 0 from the exponential fit")
+	if isinstance(weights, str):
+		if weights != "y":
+			raise Exception (f"Unknown weights {weights}")
+		weights = y ** 2
+	if weights is not None:
+		weights = np.asarray(weights, dtype=np.float64)[keep]
+	return x[keep], np.log(y[keep]), weights
+	
+def expfit(x_data, y_data, weights=None):
+	'''
+	Exponential y = C0 exp(C1 x), fit as a line through log(y)
+	weights is an array of sample weights or "y" (see _log_data), samples
+	with y <= 0 are dropped with a warning
+	Returns [coefficients, residual norm of the log fit]
+	'''
+	x, b, w = _log_data(x_data, y_data, weights)
+	c, norm = linefit(x, b, w)
+	c[0] = np.exp(c[0])
+	return [c, norm]
+	
+LOSSES = {"huber": 1.345, "tukey": 4.685}
+
+def _robust_weights(u, loss, k):
+	'''
+	IRLS weights for residuals u scaled to unit spread
+	'''
+	au = np.abs(u)
+	if loss == "huber":
+		return np.minimum(1.0, k / np.maximum(au, 1e-300))
+	return np.where(au < k, (1 - (u / k) ** 2) ** 2, 0.0)
+	
+def robust_fit(x_data, y_data, kind="line", order=1, loss="huber", weights=None, max_iter=50, tol=1e-8):
+	'''
+	Iteratively reweighted least squares fit that shrugs off outliers
+	kind is "line", "poly" (with order) or "exp" (a line through log y, with
+	weights as in expfit). loss="huber" caps the pull of large residuals,
+	"tukey" ignores residuals past 4.685 robust standard deviations.
+	The products A_i A_i^T and A_i y_i are formed once, so each iteration is
+	two weighted sums and an n x n Cholesky solve, A is never rebuilt.
+	Stops when no coefficient moves more than tol (relative) or after
+	max_iter iterations.
+	Returns [coefficients, weighted residual norm (with the weights of the
+	final solve), iterations, converged]
+	'''
+	if loss not in LOSSES:
+		raise Exception (f"Unknown robust loss {loss}")
+	if max_iter < 1:
+		raise Exception ("robust_fit needs max_iter >= 1")
+	if kind == "exp":
+		x, y, w0 = _log_data(x_data, y_data, weights)
+		order = 1
+	elif kind in ("line", "poly"):
+		x = np.asarray(x_data, dtype=np.float64)
+		y = np.asarray(y_data, dtype=np.float64)
+		w0 = None if weights is None else np.asarray(weights, dtype=np.float64)
+		order = 1 if kind == "line" else order
+	else:
+		raise Exception (f"Unknown fit kind {kind}")
+	if w0 is None:
+		w0 = np.ones(len(y))
+	A = vandermonde(x, order)
+	n = order + 1
+	Z = (A[:,:,None] * A[:,None,:]).reshape(len(y), n * n)
+	Ay = A * y[:,None]
+	w = w0
+	c = None
+	converged = False
+	for it in range(1, max_iter + 1):
+		used = w	# the weights behind c_new, w moves on past them below
+		c_new = cholesky_solve(np.dot(w, Z).reshape(n, n), np.dot(w, Ay))[:,0]
+		if c is not None and np.max(np.abs(c_new - c)) <= tol * (np.max(np.abs(c_new)) + tol):
+			c = c_new
+			converged = True
+			break
+		c = c_new
+		r = y - np.dot(A, c)
+		# robust spread from the median absolute deviation
+		scale = np.median(np.abs(r - np.median(r))) / 0.6745
+		if scale == 0:
+			converged = True
+			break
+		w = w0 * _robust_weights(r / scale, loss, LOSSES[loss])
+	r = y - np.dot(A, c)
+	norm = np.sum(used * r * r) ** (0.5)
+	if kind == "exp":
+		c[0] = np.exp(c[0])
+	return [c, norm, it, converged]
+	
+def stream_polyfit(chunks, order, method="qr"):
+	'''
+	Least squares polynomial over an iterable of (x, y) chunks
+	Each chunk's rows are folded into a LeastSquaresAccumulator and dropped,
+	so the data never has to be in memory at once, e.g. with
+	((d["Total Numbers"], d["Runtime"]) for d in pd.read_csv(f, chunksize=n))
+	order=1 is a streaming linefit.
+	Returns [coefficients, residual norm]
+	'''
+	acc = LeastSquaresAccumulator(method)
+	for x_data, y_data in chunks:
+		acc.update(vandermonde(x_data, order), y_data)
+	x, norm = acc.solve()
+	return [x[:,0], norm]
+	
+class OnlineFit(object):
+	'''
+	Recursive least squares version of linefit / polyfit / expfit
+	kind is "line", "poly" (with order) or "exp". The fitter keeps the QR
+	factors of the samples seen so far: the n x n triangle R, z = Q^T y and
+	the residual norm rho. add() rotates a new row into R with n Givens
+	rotations and remove() takes one out with the LINPACK downdate, both
+	O(n^2), so the coefficients are one back substitution away after every
+	sample with no refit and no (A^T A)^-1. forget < 1 weights older samples
+	down by that factor per sample (R, z and rho are scaled by its root).
+	Line and poly fits can use any vandermonde basis. The domain is fixed up
+	front, since the data range is not known while streaming, and
+	polyval(coeffs, x, basis, domain) evaluates the fit.
+	'''
+	def __init__(self, kind="line", order=1, forget=1.0, basis="monomial", domain=None):
+		if kind in ("line", "exp"):
+			order = 1
+		elif kind != "poly":
+			raise Exception (f"Unknown fit kind {kind}")
+		if basis not in BASES:
+			raise Exception (f"Unknown polynomial basis {basis}")
+		if basis != "monomial" and (domain is None or kind == "exp"):
+			raise Exception (f"A {basis} online fit needs a line or poly kind and a domain")
+		if not 0 < forget <= 1:
+			raise Exception ("forget must be in (0, 1]")
+		self.kind = kind
+		self.n = order + 1
+		self.forget = forget
+		self.basis = basis
+		self.domain = domain
+		self.count = 0
+		self.R = np.zeros((self.n, self.n))
+		self.z = np.zeros(self.n)
+		self.rho = 0.0
+		
+	def _row(self, x, y):
+		a = vandermonde([x], self.n - 1, self.basis, self.domain)[0]
+		if self.kind == "exp":
+			y = np.log(y)
+		return a, y
+		
+	def _samples(self, x, y):
+		'''
+		(x, y) pairs, without the y <= 0 samples of an exp fit (with a warning)
+		'''
+		samples = list(zip(np.atleast_1d(x), np.atleast_1d(y)))
+		if self.kind == "exp":
+			keep = [(xi, yi) for xi, yi in samples if yi > 0]
+			if len(keep) < len(samples):
+				warnings.warn(f"Skipped {len(samples) - len(keep)} samples with y <= 0 in the exponential fit")
+			samples = keep
+		return samples
+		
+	def add(self, x, y):
+		'''
+		Adds one sample, or every sample of array x and y
+		'''
+		lam = np.sqrt(self.forget)
+		for xi, yi in self._samples(x, y):
+			a, zeta = self._row(xi, yi)
+			if lam != 1:
+				self.R *= lam
+				self.z *= lam
+				self.rho *= lam
+			for i in range(0, self.n):
+				# rotation that zeroes a[i] against the pivot R[i, i]
+				r = np.hypot(self.R[i, i], a[i])
+				if r == 0:
+					continue
+				c, s = self.R[i, i] / r, a[i] / r
+				Ri = self.R[i, i:].copy()
+				self.R[i, i:] = c * Ri + s * a[i:]
+				a[i:] = c * a[i:] - s * Ri
+				self.z[i], zeta = c * self.z[i] + s * zeta, c * zeta - s * self.z[i]
+			self.rho = np.hypot(self.rho, zeta)
+			self.count += 1
+			
+	def remove(self, x, y):
+		'''
+		Removes one sample (or arrays of samples) that was added earlier
+		At least n samples have to stay. Rejected removes change nothing.
+		'''
+		if self.forget != 1:
+			raise Exception ("remove needs forget=1, older samples have decayed weights")
+		samples = self._samples(x, y)
+		if self.count - len(samples) < self.n:
+			raise Exception ("Not enough samples left to remove from")
+		R, z, rho = self.R.copy(), self.z.copy(), self.rho
+		for xi, yi in samples:
+			a, zeta = self._row(xi, yi)
+			# R^T p = a, the sample's share of R (|p| < 1 for a sample in the fit)
+			p = forward_sub(R.T, a)[:,0]
+			alpha = 1 - np.dot(p, p)
+			if not alpha > 0:
+				raise Exception ("Sample cannot be removed, it was not in the fit")
+			alpha = np.sqrt(alpha)
+			c = np.zeros(self.n)
+			s = np.zeros(self.n)
+			for i in range(self.n - 1, -1, -1):
+				r = np.hypot(alpha, p[i])
+				c[i], s[i] = alpha / r, p[i] / r
+				alpha = r
+			xx = np.zeros(self.n)
+			for i in range(self.n - 1, -1, -1):
+				xx, R[i] = c[i] * xx + s[i] * R[i], c[i] * R[i] - s[i] * xx
+			for i in range(0, self.n):
+				z[i] = (z[i] - s[i] * zeta) / c[i]
+				zeta = c[i] * zeta - s[i] * z[i]
+			# rounding can leave |zeta| a hair over rho on an exact fit
+			rho = rho * np.sqrt(max(1 - (zeta / rho) ** 2, 0.0)) if rho > 0 else 0.0
+		self.R, self.z, self.rho = R, z, rho
+		self.count -= len(samples)
+			
+	def fit(self):
+		'''
+		Returns [coefficients, residual norm] like linefit / polyfit / expfit
+		'''
+		if self.count < self.n or np.any(np.diagonal(self.R) == 0):
+			raise Exception ("Not enough samples to fit yet")
+		x = back_sub(self.R, self.z)[:,0]
+		if self.kind == "exp":
+			x[0] = np.exp(x[0])
+		return [x, self.rho]
+	
+def batch_polyfit(x_data, Y, order, basis="monomial", domain=None):
+	'''
+	Polynomial fits of many series sampled on the same x
+	Y is (m, s) with one series per column, all solved against one QR of the
+	shared design matrix. basis and domain are as in polyfit.
+	Returns [coefficients (order+1, s), residual norms (s,)]
+	'''
+	Y = np.asarray(Y, dtype=np.float64)
+	if np.ndim(Y) != 2:
+		raise Exception ("Y must be an (m, s) array, one series per column")
+	x, norm = QRFactor(vandermonde(x_data, order, basis, domain), overwrite_a=True).solve(Y)
+	return [x, np.atleast_1d(norm)]
+	
+def batch_linefit(x_data, Y):
+	'''
+	Line fits of many series sampled on the same x, see batch_polyfit
+	'''
+	return batch_polyfit(x_data, Y, 1)
+	
+def batch_expfit(x_data, Y):
+	'''
+	Exponential fits of many series sampled on the same x, see batch_polyfit
+	The norms are for the log fits, as in expfit. Series with any y <= 0
+	drop those samples (with one warning for all of them) and are fit on
+	their own, the rest still share one factorization.
+	'''
+	Y = np.asarray(Y, dtype=np.float64)
+	if np.ndim(Y) != 2:
+		raise Exception ("Y must be an (m, s) array, one series per column")
+	bad = np.any(Y <= 0, axis=0)
+	x = np.zeros((2, len(Y[0])))
+	norm = np.zeros(len(Y[0]))
+	if not np.all(bad):
+		x[:,~bad], norm[~bad] = batch_polyfit(x_data, np.log(Y[:,~bad]), 1)
+	if np.any(bad):
+		warnings.warn(f"Dropped samples with y <= 0 from {np.sum(bad)} series of the exponential fit")
+		xd = np.asarray(x_data, dtype=np.float64)
+		for j in np.flatnonzero(bad):
+			keep = Y[:,j] > 0
+			x[:,j], norm[j] = linefit(xd[keep], np.log(Y[keep,j]))
+	x[0] = np.exp(x[0])
+	return [x, norm]
+	
+def group_series(df, by, x, y):
+	'''
+	Reshapes a long DataFrame (one row per sample) into batch fit input
+	Rows are grouped by the by column and lined up on the x column, so every
+	group has to be sampled on the same x values.
+	Returns (x values, Y with one column per group, group keys)
+	'''
+	wide = df.pivot(index=x, columns=by, values=y).sort_index()
+	if wide.isna().to_numpy().any():
+		raise Exception ("Groups are not sampled on a shared x grid")
+	return wide.index.to_numpy(dtype=np.float64), wide.to_numpy(dtype=np.float64), list(wide.columns)
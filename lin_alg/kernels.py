@@ -0,0 +1,119 @@
+# Cowboy Linear Algebra python library - numba compiled kernels
+# By: Nick the Space Cowboy
+# Only imported by backend.jit_kernel once the numba backend is selected.
+# nogil lets the kernels run in parallel threads and cache keeps the
+# compiled code on disk so new processes skip the JIT step. The numpy error
+# model makes a zero pivot give inf/nan like the numpy backend does, instead
+# of raising ZeroDivisionError.
+
+import numpy as np
+from numba import njit
+
+@njit(nogil=True, cache=True, error_model="numpy")
+def back_sub(U, b):
+	'''
+	back substitution of the (m, n) upper triangular U against an (m, k) b
+	'''
+	m, n = U.shape
+	k = b.shape[1]
+	x = np.zeros((n, k))
+	for i in range(m - 1, -1, -1):
+		r = 1.0 / U[i, i]
+		for c in range(0, k):
+			s = b[i, c]
+			for j in range(i + 1, m):
+				s -= U[i, j] * x[j, c]
+			x[i, c] = s * r
+	return x
+	
+@njit(nogil=True, cache=True, error_model="numpy")
+def SGE(U, c, L):
+	'''
+	structured gaussian elimination of U (and c), writing multipliers into L
+	'''
+	m, n = U.shape
+	for i in range(0, min(m, n)):
+		r = 1.0 / U[i, i]
+		for j in range(i + 1, m):
+			l = U[j, i] * r
+			L[j, i] = l
+			for t in range(i, n):
+				U[j, t] -= l * U[i, t]
+			for t in range(0, c.shape[1]):
+				c[j, t] -= l * c[i, t]
+				
+@njit(nogil=True, cache=True)
+def cholesky(L):
+	'''
+	in place Cholesky of the lower triangle of L
+	Returns -1, or the index of the first non-positive pivot.
+	'''
+	n = L.shape[0]
+	for j in range(0, n):
+		for i in range(j, n):
+			s = L[i, j]
+			for k in range(0, j):
+				s -= L[i, k] * L[j, k]
+			L[i, j] = s
+		if not L[j, j] > 0:
+			return j
+		d = np.sqrt(L[j, j])
+		L[j, j] = d
+		for i in range(j + 1, n):
+			L[i, j] /= d
+	for i in range(0, n):
+		for j in range(i + 1, n):
+			L[i, j] = 0.0
+	return -1
+	
+@njit(nogil=True, cache=True, error_model="numpy")
+def gram_schmidt(A):
+	'''
+	modified Gram-Schmidt orthonormalization of the columns of A
+	'''
+	m, n = A.shape
+	Q = np.zeros((m, n))
+	for i in range(0, n):
+		for t in range(0, m):
+			Q[t, i] = A[t, i]
+		for j in range(0, i):
+			inner = 0.0
+			for t in range(0, m):
+				inner += Q[t, j] * Q[t, i]
+			for t in range(0, m):
+				Q[t, i] -= inner * Q[t, j]
+		norm = 0.0
+		for t in range(0, m):
+			norm += Q[t, i] ** 2
+		norm = np.sqrt(norm)
+		for t in range(0, m):
+			Q[t, i] /= norm
+	return Q
+	
+@njit(nogil=True, cache=True)
+def bareiss(A):
+	'''
+	fraction free (Bareiss) determinant of an integer matrix, in place
+	'''
+	n = A.shape[0]
+	sign = 1
+	prev = 1
+	for k in range(0, n - 1):
+		if A[k, k] == 0:
+			p = -1
+			for l in range(k + 1, n):
+				if A[l, k] != 0:
+					p = l
+					break
+			if p < 0:
+				return 0
+			for t in range(0, n):
+				tmp = A[k, t]
+				A[k, t] = A[p, t]
+				A[p, t] = tmp
+			sign = -sign
+		for i in range(k + 1, n):
+			for j in range(k + 1, n):
+				A[i, j] = (A[k, k] * A[i, j] - A[i, k] * A[k, j]) // prev
+		prev = A[k, k]
+	return sign * A[n - 1, n - 1]
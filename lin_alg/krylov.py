@@ -0,0 +1,151 @@
+# Cowboy Linear Algebra python library - Krylov iterative solvers
+# By: Nick the Space Cowboy
+
+import numpy as np
+from .sparse import CSRMatrix, SparseFactor, analyze, to_csr
+from .triangular import back_sub
+
+def _operator(A):
+	'''
+	x -> Ax for a dense array, a CSRMatrix or a matvec callable
+	'''
+	if callable(A):
+		return A
+	if isinstance(A, CSRMatrix):
+		return A.dot
+	A = np.asarray(A, dtype=np.float64)
+	return lambda x: np.dot(A, x)
+	
+def _preconditioner(M):
+	'''
+	r -> M^-1 r for None (identity), a callable or a factor object with solve
+	'''
+	if M is None:
+		return lambda r: r
+	if callable(M):
+		return M
+	return lambda r: M.solve(r).ravel()
+	
+def _diagonal(A):
+	if isinstance(A, CSRMatrix):
+		d = np.zeros(A.shape[0], dtype=np.float64)
+		rows = A.row_ids()
+		on = rows == A.indices
+		d[rows[on]] = A.data[on]
+		return d
+	return np.array(np.diagonal(A), dtype=np.float64)
+	
+def jacobi(A):
+	'''
+	Jacobi (diagonal) preconditioner, divides the residual by diag(A)
+	'''
+	rd = 1.0 / _diagonal(A)
+	return lambda r: r * rd
+	
+def ichol(A):
+	'''
+	Incomplete Cholesky IC(0): the sparse cholesky restricted to A's own pattern
+	Raises NotPosDefError when the incomplete factorization breaks down.
+	'''
+	A = A if isinstance(A, CSRMatrix) else to_csr(A)
+	return SparseFactor(A, analyze(A, None, fill=False), "cholesky")
+	
+def ilu(A):
+	'''
+	Incomplete LU ILU(0): the sparse LU restricted to A's own pattern
+	'''
+	A = A if isinstance(A, CSRMatrix) else to_csr(A)
+	return SparseFactor(A, analyze(A, None, fill=False), "lu")
+	
+def cg(A, b, M=None, x0=None, tol=1e-8, max_iter=None):
+	'''
+	Preconditioned conjugate gradient for symmetric positive definite A
+	A may be a dense array, a CSRMatrix or a function returning Ax, and M a
+	preconditioner (jacobi, ichol or any callable r -> M^-1 r).
+	Returns (x, history) with history the relative residual norm
+	|b - Ax| / |b| after every iteration; x has the shape of b.
+	'''
+	shape = np.shape(b)
+	matvec = _operator(A)
+	precond = _preconditioner(M)
+	b = np.ravel(np.array(b, dtype=np.float64))
+	n = len(b)
+	max_iter = max_iter or 10 * n
+	x = np.zeros(n) if x0 is None else np.ravel(np.array(x0, dtype=np.float64))
+	r = b - matvec(x)
+	bnorm = np.linalg.norm(b) or 1.0
+	history = [np.linalg.norm(r) / bnorm]
+	z = precond(r)
+	p = z.copy()
+	rz = np.dot(r, z)
+	for it in range(0, max_iter):
+		if history[-1] <= tol:
+			break
+		Ap = matvec(p)
+		alpha = rz / np.dot(p, Ap)
+		x += alpha * p
+		r -= alpha * Ap
+		history.append(np.linalg.norm(r) / bnorm)
+		z = precond(r)
+		rz_new = np.dot(r, z)
+		p = z + (rz_new / rz) * p
+		rz = rz_new
+	return x.reshape(shape), history
+	
+def gmres(A, b, M=None, x0=None, tol=1e-8, restart=30, max_iter=None):
+	'''
+	Restarted GMRES(restart) for general square A, right preconditioned so
+	the residual it tracks is the true one
+	A and M are taken the same ways as in cg. Returns (x, history) with
+	history the relative residual norm after every inner iteration.
+	'''
+	shape = np.shape(b)
+	matvec = _operator(A)
+	precond = _preconditioner(M)
+	b = np.ravel(np.array(b, dtype=np.float64))
+	n = len(b)
+	max_iter = max_iter or 10 * n
+	restart = min(restart, n)
+	x = np.zeros(n) if x0 is None else np.ravel(np.array(x0, dtype=np.float64))
+	bnorm = np.linalg.norm(b) or 1.0
+	r = b - matvec(x)
+	beta = np.linalg.norm(r)
+	history = [beta / bnorm]
+	total = 0
+	while history[-1] > tol and total < max_iter:
+		V = np.zeros([restart + 1, n])
+		H = np.zeros([restart + 1, restart])
+		cs = np.zeros(restart)
+		sn = np.zeros(restart)
+		g = np.zeros(restart + 1)
+		g[0] = beta
+		V[0] = r / beta
+		k = 0
+		for k in range(0, restart):
+			w = matvec(precond(V[k]))
+			for i in range(0, k + 1):	# modified Gram-Schmidt against the basis so far
+				H[i, k] = np.dot(w, V[i])
+				w -= H[i, k] * V[i]
+			H[k+1, k] = np.linalg.norm(w)
+			if H[k+1, k] != 0:
+				V[k+1] = w / H[k+1, k]
+			for i in range(0, k):	# apply the earlier Givens rotations to the new column
+				H[i, k], H[i+1, k] = cs[i] * H[i, k] + sn[i] * H[i+1, k], -sn[i] * H[i, k] + cs[i] * H[i+1, k]
+			rho = np.hypot(H[k, k], H[k+1, k])
+			cs[k], sn[k] = H[k, k] / rho, H[k+1, k] / rho
+			H[k, k] = rho
+			H[k+1, k] = 0
+			g[k+1] = -sn[k] * g[k]
+			g[k] = cs[k] * g[k]
+			history.append(abs(g[k+1]) / bnorm)
+			total += 1
+			if history[-1] <= tol or total >= max_iter:
+				break
+		y = back_sub(H[:k+1, :k+1], g[:k+1])[:, 0]
+		x += precond(np.dot(V[:k+1].T, y))
+		r = b - matvec(x)
+		beta = np.linalg.norm(r)
+		history[-1] = beta / bnorm	# true residual at the end of the cycle
+		if beta == 0:
+			break
+	return x.reshape(shape), history
@@ -0,0 +1,18 @@
+# Cowboy Linear Algebra python library
+# By: Nick the Space Cowboy
+# Everything in one namespace for the `from lin_alg import lin_alg` drivers
+
+from .backend import *
+from .banded import *
+from .batched import *
+from .cholesky import *
+from .determinants import *
+from .errors import *
+from .fitting import *
+from .krylov import *
+from .lstsq import *
+from .lu import *
+from .orthogonal import *
+from .parallel import *
+from .sparse import *
+from .triangular import *
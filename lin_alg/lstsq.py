@@ -0,0 +1,198 @@
+# Cowboy Linear Algebra python library - least squares
+# By: Nick the Space Cowboy
+
+import numpy as np
+from .cholesky import cholesky
+from .lu import _inv_norm1
+from .triangular import back_sub, forward_sub
+
+def _householder(F, n):
+	'''
+	Householder QR of the first n columns of F, in place
+	Every column of F is carried through the reflections, so extra columns
+	past n come out as Q^T times themselves. R ends up on and above the
+	diagonal and each reflector v (v[0] = 1 implied) below it.
+	Returns the reflector scalings tau, H_k = I - tau_k v_k v_k^T (tau_k = 0
+	when column k is already zero below the diagonal).
+	'''
+	tau = np.zeros(n)
+	for k in range(0, min(len(F) - 1, n)):
+		x = F[k:, k]
+		xnorm = np.linalg.norm(x)
+		if xnorm == 0:
+			continue
+		alpha = -xnorm if x[0] >= 0 else xnorm
+		v0 = x[0] - alpha
+		x[1:] /= v0
+		tau[k] = -v0 / alpha
+		F[k, k] = alpha
+		if k + 1 < len(F[0]):
+			# one rank-1 update of the trailing columns per reflector
+			w = F[k, k+1:] + np.dot(x[1:], F[k+1:, k+1:])
+			w *= tau[k]
+			F[k, k+1:] -= w
+			F[k+1:, k+1:] -= np.multiply.outer(x[1:], w)
+	return tau
+
+def _qr_update(R, block):
+	'''
+	Folds a block of rows into the triangular factor R of the rows seen so far
+	R is (at most) p x p for p columns, the stacked [R; block] is factored and
+	its new triangle returned, so Q is never stored. Passing every row block of
+	[A b] through here gives the R of [A b] in a single pass over A.
+	'''
+	S = np.concatenate([R, np.asarray(block, dtype=np.float64)])
+	_householder(S, len(S[0]))
+	return np.triu(S[:len(S[0])])
+
+def _check_rank(R):
+	'''
+	Raises on a zero pivot in the triangular factor
+	'''
+	if np.any(np.diagonal(R) == 0):
+		raise Exception ("Matrix is rank deficient")
+
+class QRFactor(object):
+	'''
+	Factor once / solve many Householder QR of a tall m x n matrix
+	Q is never formed, it is kept as the n reflectors below R.
+	'''
+	def __init__(self, A, overwrite_a=False):
+		if overwrite_a and isinstance(A, np.ndarray) and A.dtype == np.float64:
+			self.F = A
+		else:
+			self.F = np.array(A, dtype=np.float64, order="F")
+		self.n = len(self.F[0])
+		if len(self.F) < self.n:
+			raise Exception ("Least squares needs at least as many rows as columns")
+		self.tau = _householder(self.F, self.n)
+		_check_rank(self.F[:self.n, :self.n])
+
+	@property
+	def R(self):
+		return np.triu(self.F[:self.n])
+
+	def apply_qt(self, b):
+		'''
+		Returns Q^T b as an (m, k) array
+		'''
+		c = np.array(b, dtype=np.float64).reshape(len(self.F), -1)
+		for k in range(0, self.n):
+			w = self.tau[k] * (c[k] + np.dot(self.F[k+1:, k], c[k+1:]))
+			c[k] -= w
+			c[k+1:] -= np.multiply.outer(self.F[k+1:, k], w)
+		return c
+
+	def solve(self, b):
+		'''
+		Least squares solution of Ax = b, returns (x, residual norm)
+		The norm is read off the tail of Q^T b, A x is never formed.
+		'''
+		c = self.apply_qt(b)
+		x = back_sub(self.F[:self.n], c[:self.n])
+		return x, _tail_norm(c[self.n:])
+
+	def cond(self):
+		'''
+		Estimate of the 1-norm condition number of R (A's condition number up
+		to a factor of n, since Q is orthogonal)
+		'''
+		R = self.R
+		rnorm = np.max(np.sum(np.abs(R), axis=0))
+		solve = lambda x: back_sub(R, x)
+		solve_transpose = lambda x: forward_sub(R.T, x)
+		return rnorm * _inv_norm1(solve, solve_transpose, self.n)
+
+def _tail_norm(r):
+	'''
+	Residual norm from the rows of Q^T b past n, one per column when k > 1
+	'''
+	if r.shape[1] > 1:
+		return np.linalg.norm(r, axis=0)
+	return np.linalg.norm(r)
+
+class LeastSquaresAccumulator(object):
+	'''
+	Streaming least squares over row blocks of [A b]
+	Blocks are folded in with update() as they arrive and never kept, so A
+	does not have to fit in memory. method="qr" keeps the (n+k) x (n+k)
+	triangle of [A b] (tall skinny QR), method="cholesky" keeps A^T A, A^T b
+	and |b|^2. Either way solve() gives (x, residual norm) at any point.
+	'''
+	def __init__(self, method="qr"):
+		if method not in ("qr", "cholesky"):
+			raise Exception (f"Unknown least squares method {method}")
+		self.method = method
+		self.rows = 0
+		self.n = None
+		
+	def update(self, A, b):
+		'''
+		Adds the rows A (m x n) and b (m or m x k)
+		'''
+		A = np.asarray(A, dtype=np.float64)
+		b = np.asarray(b, dtype=np.float64).reshape(len(A), -1)
+		if self.n is None:
+			self.n = len(A[0])
+			self.k = len(b[0])
+			if self.method == "qr":
+				self.R = np.zeros((0, self.n + self.k))
+			else:
+				self.G = np.zeros((self.n, self.n))
+				self.d = np.zeros((self.n, self.k))
+				self.bb = np.zeros(self.k)
+		elif len(A[0]) != self.n or len(b[0]) != self.k:
+			raise Exception ("Block shape does not match the earlier blocks")
+		if self.method == "qr":
+			self.R = _qr_update(self.R, np.hstack([A, b]))
+		else:
+			self.G += np.dot(A.T, A)
+			self.d += np.dot(A.T, b)
+			self.bb += np.sum(b * b, axis=0)
+		self.rows += len(A)
+		
+	def solve(self):
+		'''
+		Returns (x, residual norm) for all the rows added so far
+		'''
+		n = self.n
+		if n is None or self.rows < n:
+			raise Exception ("Least squares needs at least as many rows as columns")
+		if self.method == "qr":
+			R = self.R
+			_check_rank(R[:n, :n])
+			x = back_sub(R[:n, :n], R[:n, n:])
+			return x, _tail_norm(R[n:, n:])
+		L = cholesky(self.G)
+		x = back_sub(L.T, forward_sub(L, self.d))
+		# |b - Ax|^2 = |b|^2 - x^T A^T b since A^T A x = A^T b
+		norm = np.sqrt(np.maximum(self.bb - np.sum(x * self.d, axis=0), 0))
+		return x, norm if len(norm) > 1 else norm[0]
+		
+def stream_least_squares(blocks, method="qr"):
+	'''
+	Least squares over an iterable (or generator) of (A, b) row blocks
+	Returns (x, residual norm) like least_squares, holding one block at a time
+	'''
+	acc = LeastSquaresAccumulator(method)
+	for A, b in blocks:
+		acc.update(A, b)
+	return acc.solve()
+	
+def least_squares(A, b, method="qr", chunk=1024):
+	'''
+	Solves the least squares problem min |Ax - b|
+	method="qr" (default) uses Householder QR on [A b], so Q^T b comes out of
+	the factorization and the residual norm is the length of its tail. The
+	rows are folded in chunk rows at a time (tall skinny QR), one pass over A
+	and only a (n+k) x (n+k) triangle kept between chunks.
+	method="cholesky" is the opt-in fast path: A^T A and A^T b are built in
+	one pass and solved by Cholesky. It squares the condition number of A,
+	so only use it on well conditioned problems.
+	b may be an (m, k) block, in which case one norm per column is returned
+	'''
+	m, n = np.shape(A)
+	if m < n:
+		raise Exception ("Least squares needs at least as many rows as columns")
+	b = np.reshape(b, (m, -1))
+	return stream_least_squares(((A[i:i+chunk], b[i:i+chunk]) for i in range(0, m, chunk)), method)
@@ -0,0 +1,261 @@
+# Cowboy Linear Algebra python library - LU type decompositions
+# By: Nick the Space Cowboy
+
+import numpy as np
+from .backend import jit_kernel
+from .triangular import back_sub, forward_sub
+from .sparse import CSRMatrix, SparseFactor
+
+def SGE(A, b=None):
+	'''
+	function to perform structured gaussian elimination 
+	If a b vector isn't passed through, a LU decomposition is returned
+	b may also be an (m, k) block of right-hand sides, which are all carried
+	through each elimination step at once. A and b are never modified.
+	'''
+	m = len(A)
+	n = len(A[0])
+	L = np.identity(m, dtype=np.float64)
+	U = np.array(A, dtype=np.float64)
+	c = np.array(b, dtype=np.float64)
+	b_state = b is not None
+	kernel = jit_kernel("SGE")
+	if kernel is not None:
+		kernel(U, c.reshape(m, -1) if b_state else np.zeros([m, 0]), L)
+	else:
+		for i in range(0, min(m, n), 1):
+			L[i+1:, i] = U[i+1:, i] / U[i, i]
+			# rank-1 update of every row below the pivot (and every rhs column)
+			U[i+1:] -= np.multiply.outer(L[i+1:, i], U[i])
+			if b_state == False:
+				pass
+			else:
+				c[i+1:] -= np.multiply.outer(L[i+1:, i], c[i])
+	if b_state==False:
+		return L, U
+	else:
+		return U, c
+	
+def _lu_panel(F, perm, k0, k1, ncol):
+	'''
+	Pivoted elimination of columns k0:k1 of the packed array F
+	Row updates only reach up to column ncol. Returns the sign of the swaps.
+	'''
+	sign = 1
+	for k in range(k0, k1):
+		p = k + np.argmax(np.abs(F[k:, k]))	# largest pivot in the column
+		if F[p, k] == 0:
+			raise Exception ("Matrix is singular")
+		if p != k:
+			F[[k, p]] = F[[p, k]]
+			perm[[k, p]] = perm[[p, k]]
+			sign = -sign
+		F[k+1:, k] *= 1.0 / F[k, k]
+		F[k+1:, k+1:ncol] -= np.multiply.outer(F[k+1:, k], F[k, k+1:ncol])
+	return sign
+
+def _lu_packed(A, overwrite_a=False, block_size=None, dtype=np.float64):
+	'''
+	Partial pivoting LU stored in a single array
+	L (unit diagonal implied) sits below the diagonal and U on and above it.
+	With a block_size the factorization is right-looking blocked: each panel
+	is eliminated on its own and the trailing matrix gets a single
+	matrix-matrix update per panel.
+	dtype=np.float32 factors in single precision (see refine_solve).
+	Returns the packed array, the row permutation and the permutation sign.
+	'''
+	if overwrite_a and isinstance(A, np.ndarray) and A.dtype == dtype:
+		F = A
+	else:
+		F = np.array(A, dtype=dtype)
+	m = len(F)
+	n = len(F[0])
+	kmax = min(m, n)
+	perm = np.arange(m)
+	if block_size is None:
+		return F, perm, _lu_panel(F, perm, 0, kmax, n)
+	sign = 1
+	for k0 in range(0, kmax, block_size):
+		k1 = min(k0 + block_size, kmax)
+		sign *= _lu_panel(F, perm, k0, k1, k1)
+		if k1 < n:
+			# U12 = L11^-1 A12, then the trailing A22 -= L21 U12
+			F[k0:k1, k1:] = forward_sub(F[k0:k1, k0:k1], F[k0:k1, k1:], unit_diagonal=True)
+			F[k1:, k1:] -= np.dot(F[k1:, k0:k1], F[k0:k1, k1:])
+	return F, perm, sign
+	
+def LU(A, pivot=False, overwrite_a=False, engine="rank1", block_size=64, symbolic=None):
+	'''
+	Function to perform LU decomposition
+	pivot=True uses partial pivoting and returns (LU, perm) with L and U packed
+	into one array, so that A[perm] = LU. overwrite_a=True reuses A's memory
+	for the factors when A is already a float64 array.
+	engine="blocked" factors block_size columns at a time with one matrix
+	product per panel for the trailing update (always pivoted and packed).
+	A CSRMatrix A gives back a SparseFactor (fill reducing ordering, static
+	pivots), reusing the pattern analysis in symbolic when one is passed.
+	'''
+	if isinstance(A, CSRMatrix):
+		return SparseFactor(A, symbolic, "lu")
+	if engine == "blocked":
+		F, perm, sign = _lu_packed(A, overwrite_a, block_size)
+		return F, perm
+	elif engine != "rank1":
+		raise Exception (f"Unknown LU engine {engine}")
+	if pivot:
+		F, perm, sign = _lu_packed(A, overwrite_a)
+		return F, perm
+	return SGE(A)
+	
+def _inv_norm1(solve, solve_transpose, n):
+	'''
+	Estimate of |A^-1|_1 from solves with A and A^T (Hager's method with
+	Higham's refinements), a handful of O(n^2) solves instead of the inverse
+	'''
+	x = np.full(n, 1.0 / n)
+	est = 0.0
+	for k in range(0, 5):
+		y = np.reshape(solve(x), -1)
+		est = np.sum(np.abs(y))
+		xi = np.where(y >= 0, 1.0, -1.0)
+		z = np.reshape(solve_transpose(xi), -1)
+		j = np.argmax(np.abs(z))
+		if k > 0 and np.abs(z[j]) <= np.dot(z, x):
+			break
+		x = np.zeros(n)
+		x[j] = 1.0
+	# alternating vector guards against the cases where the search stalls
+	alt = (-1.0) ** np.arange(n) * (1 + np.arange(n) / max(n - 1, 1))
+	return max(est, 2 * np.sum(np.abs(solve(alt))) / (3 * n))
+	
+class LUFactor(object):
+	'''
+	Factor once / solve many LU decomposition
+	L (unit diagonal implied) and U are packed into one n x n array next to
+	the row permutation, so every solve after the first is just a forward and
+	a back substitution
+	Two health checks come with the factors: growth, the pivot growth factor
+	max|U| / max|A|, and cond(), an O(n^2) estimate of the 1-norm condition
+	number.
+	'''
+	def __init__(self, A, overwrite_a=False, block_size=None, dtype=np.float64):
+		m = len(A)
+		n = len(A[0])
+		if m != n:
+			raise Exception ("LUFactor needs a square matrix")
+		# taken before the factorization, which may overwrite A
+		self.anorm = np.max(np.sum(np.abs(A), axis=0))
+		amax = np.max(np.abs(A))
+		self.LU, self.perm, self.sign = _lu_packed(A, overwrite_a, block_size, dtype)
+		self.growth = np.max(np.abs(np.triu(self.LU))) / amax if amax else 1.0
+		
+	def solve_transpose(self, b):
+		'''
+		Solves A^T x = b with the cached factors (A^T = U^T L^T P)
+		'''
+		y = forward_sub(self.LU.T, b)
+		y = back_sub(self.LU.T, y, unit_diagonal=True)
+		x = np.zeros_like(y)
+		x[self.perm] = y
+		return x
+		
+	def cond(self):
+		'''
+		Estimate of the 1-norm condition number |A|_1 |A^-1|_1
+		'''
+		return self.anorm * _inv_norm1(self.solve, self.solve_transpose, len(self.LU))
+		
+	def solve(self, b):
+		'''
+		Solves Ax = b with the cached factors
+		'''
+		c = np.array(b, dtype=np.float64)[self.perm]
+		y = forward_sub(self.LU, c, unit_diagonal=True)
+		return back_sub(self.LU, y)
+		
+	def solve_many(self, B):
+		'''
+		Solves AX = B for an (n, k) block of right-hand sides in one sweep
+		'''
+		if np.ndim(B) != 2:
+			raise Exception ("B must be an (n, k) array")
+		return self.solve(B)
+		
+	def det(self):
+		'''
+		Determinant from the product of U's pivots
+		'''
+		return self.sign * np.prod(np.diagonal(self.LU))
+		
+	def logdet(self):
+		'''
+		Returns (sign, log|det|), which does not overflow for large n
+		'''
+		d = np.diagonal(self.LU)
+		sign = self.sign * np.prod(np.sign(d))
+		return sign, np.sum(np.log(np.abs(d)))
+	
+def refine_solve(A, b, tol=None, max_iter=10):
+	'''
+	Mixed precision solve of Ax = b with iterative refinement
+	A is factored once in float32 (half the memory traffic), then the float32
+	solution is corrected with residuals computed in float64 until the
+	normwise backward error |b - Ax| / (|A| |x| + |b|) drops below tol
+	(default sqrt(n) * float64 eps). If refinement stalls or runs out of
+	iterations the system is re-solved with a float64 factorization.
+	Returns (x, iterations, backward error); iterations is negative when the
+	float64 fallback was used.
+	'''
+	if max_iter < 1:
+		raise Exception ("refine_solve needs max_iter >= 1")
+	A = np.asarray(A, dtype=np.float64)
+	b = np.array(b, dtype=np.float64).reshape(len(A), -1)
+	n = len(A)
+	if tol is None:
+		tol = np.sqrt(n) * np.finfo(np.float64).eps
+	anorm = np.max(np.sum(np.abs(A), axis=1))	# infinity norm
+	bnorm = np.max(np.abs(b))
+	
+	def backward_error(x):
+		r = b - np.dot(A, x)
+		return r, np.max(np.abs(r)) / (anorm * np.max(np.abs(x)) + bnorm)
+		
+	f32 = LUFactor(A, dtype=np.float32)
+	x = f32.solve(b)
+	r, berr = backward_error(x)
+	for it in range(1, max_iter + 1):
+		if berr <= tol:
+			return x, it - 1, berr
+		x_new = x + f32.solve(r)
+		r_new, berr_new = backward_error(x_new)
+		if not berr_new < berr:	# stalled (or nan), A is too ill conditioned for float32
+			break
+		x, r, berr = x_new, r_new, berr_new
+	if berr <= tol:
+		return x, max_iter, berr
+	x = LUFactor(A).solve(b)
+	r, berr = backward_error(x)
+	return x, -it, berr
+	
+def LDV(A, vector_d=False, shared=False):
+	'''
+	Function to perform a LDV Matrix decomposition
+	V comes from scaling each row of U by its pivot, no inverse of D is formed.
+	vector_d=True returns D as a 1-D array of its diagonal. shared=True returns
+	(F, d) where F holds L below the diagonal and V on and above it (both unit
+	diagonals implied), so V is a view of the same storage as L.
+	'''
+	L, U = LU(A)
+	m = len(A)
+	n = len(A[0])
+	d = np.ones(m, dtype=np.float64)
+	d[:min(m, n)] = np.diagonal(U)
+	V = U
+	V /= d[:, None]	# U is a fresh copy from SGE, scale its rows in place
+	if shared:
+		lower = np.tril_indices(m, -1, n)
+		V[lower] = L[lower]
+		return V, d
+	if vector_d:
+		return L, d, V
+	return L, np.diag(d), V
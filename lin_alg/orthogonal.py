@@ -0,0 +1,23 @@
+# Cowboy Linear Algebra python library - orthogonalization
+# By: Nick the Space Cowboy
+
+import numpy as np
+from .backend import jit_kernel
+
+def gram_schmidt(A):
+	'''
+	Gram-Schmidt process, returns Q with orthonormal columns spanning A's columns
+	'''
+	kernel = jit_kernel("gram_schmidt")
+	if kernel is not None:
+		return kernel(np.ascontiguousarray(A, dtype=np.float64))
+	m, n  = A.shape
+	Q = np.zeros((m, n))
+	Q[:, 0] = A[:, 0] / np.linalg.norm(A[:, 0], 2)
+	for i in range(1, n):
+		Q[:, i] = A[:, i]
+		for j in range(0, i):
+			inner = np.dot(Q[:, j].T, Q[:, i])
+			Q[:, i] = Q[:, i] - np.dot(inner, Q[:, j])
+		Q[:, i] = Q[:, i] / np.linalg.norm(Q[:, i], 2)
+	return Q
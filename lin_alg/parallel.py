@@ -0,0 +1,106 @@
+# Cowboy Linear Algebra python library - parallel execution of independent problems
+# By: Nick the Space Cowboy
+
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from .banded import solve
+from .cholesky import cholesky, cholesky_solve
+from .lstsq import least_squares
+from .lu import LU, LUFactor
+
+METHODS = ("lu", "cholesky", "least_squares", "auto")
+
+def _run(method, A, b):
+	'''
+	One task: a factorization when b is None, otherwise a solve
+	'''
+	if method == "lu":
+		return LU(A, pivot=True) if b is None else LUFactor(A).solve(b)
+	elif method == "cholesky":
+		return cholesky(A) if b is None else cholesky_solve(A, b)
+	elif b is None:
+		raise Exception (f"Method {method} needs a right-hand side")
+	elif method == "least_squares":
+		return least_squares(A, b)
+	elif method == "auto":
+		return solve(A, b)
+	raise Exception (f"Unknown method {method}")
+	
+def _share(a):
+	'''
+	Copies a into a new shared memory block, returns the block and its descriptor
+	'''
+	a = np.ascontiguousarray(a, dtype=np.float64)
+	shm = shared_memory.SharedMemory(create=True, size=max(a.nbytes, 1))
+	np.ndarray(a.shape, dtype=np.float64, buffer=shm.buf)[...] = a
+	return shm, (shm.name, a.shape)
+	
+def _process_task(method, a_desc, b_desc):
+	'''
+	Worker side of a process pool task: attach to the shared inputs and run it
+	'''
+	blocks = []
+	arrays = []
+	for desc in (a_desc, b_desc):
+		if desc is None:
+			arrays.append(None)
+			continue
+		shm = shared_memory.SharedMemory(name=desc[0])
+		blocks.append(shm)
+		arrays.append(np.ndarray(desc[1], dtype=np.float64, buffer=shm.buf))
+	try:
+		return _run(method, arrays[0], arrays[1])
+	finally:
+		del arrays	# the views have to go before the blocks can close
+		for shm in blocks:
+			shm.close()
+			
+def solve_all(systems, method="lu", workers=None, executor="thread"):
+	'''
+	Runs many independent factorizations/solves in parallel
+	systems is a list of (A, b) pairs (b=None factors A only) and method is
+	one of METHODS. executor="thread" uses a thread pool, which scales when
+	the work is in BLAS or in nogil numba kernels. executor="process" uses a
+	process pool for the pure python kernels and hands the arrays over in
+	shared memory instead of pickling them.
+	Returns (results, errors): errors[i] is None or the exception task i
+	raised, in which case results[i] is None.
+	'''
+	if method not in METHODS:
+		raise Exception (f"Unknown method {method}")
+	workers = workers or os.cpu_count()
+	blocks = []
+	if executor == "thread":
+		pool = ThreadPoolExecutor(workers)
+		futures = [pool.submit(_run, method, A, b) for A, b in systems]
+	elif executor == "process":
+		pool = ProcessPoolExecutor(workers)
+		futures = []
+		for A, b in systems:
+			a_shm, a_desc = _share(A)
+			blocks.append(a_shm)
+			b_desc = None
+			if b is not None:
+				b_shm, b_desc = _share(b)
+				blocks.append(b_shm)
+			futures.append(pool.submit(_process_task, method, a_desc, b_desc))
+	else:
+		raise Exception (f"Unknown executor {executor}")
+	results = []
+	errors = []
+	try:
+		for f in futures:
+			try:
+				results.append(f.result())
+				errors.append(None)
+			except Exception as e:
+				results.append(None)
+				errors.append(e)
+	finally:
+		pool.shutdown()
+		for shm in blocks:
+			shm.close()
+			shm.unlink()
+	return results, errors
@@ -0,0 +1,233 @@
+# Cowboy Linear Algebra python library - sparse (CSR) factorizations
+# By: Nick the Space Cowboy
+
+import numpy as np
+from .errors import NotPosDefError
+
+class CSRMatrix(object):
+	'''
+	Compressed sparse row matrix
+	Row i keeps its column indices in indices[indptr[i]:indptr[i+1]] (sorted)
+	and the matching values in data.
+	'''
+	def __init__(self, data, indices, indptr, shape):
+		self.data = np.asarray(data, dtype=np.float64)
+		self.indices = np.asarray(indices, dtype=np.int64)
+		self.indptr = np.asarray(indptr, dtype=np.int64)
+		self.shape = tuple(shape)
+		
+	def __len__(self):
+		return self.shape[0]
+		
+	def row_ids(self):
+		'''
+		Row index of every stored entry
+		'''
+		return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+		
+	def transpose(self):
+		return _csr_from_triplets(self.indices, self.row_ids(), self.data, self.shape[::-1])
+		
+	def dot(self, x):
+		'''
+		Matrix product with a vector or (n, k) block
+		'''
+		x = np.asarray(x, dtype=np.float64)
+		rows = self.row_ids()
+		if x.ndim == 1:
+			return np.bincount(rows, weights=self.data * x[self.indices], minlength=self.shape[0])
+		y = np.zeros([self.shape[0], x.shape[1]], dtype=np.float64)
+		np.add.at(y, rows, self.data[:, None] * x[self.indices])
+		return y
+		
+	def to_dense(self):
+		A = np.zeros(self.shape, dtype=np.float64)
+		A[self.row_ids(), self.indices] = self.data
+		return A
+		
+def _csr_from_triplets(i, j, v, shape):
+	'''
+	CSRMatrix from (row, column, value) triplets
+	'''
+	order = np.lexsort((j, i))
+	indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+	indptr[1:] = np.cumsum(np.bincount(i, minlength=shape[0]))
+	return CSRMatrix(np.asarray(v)[order], np.asarray(j)[order], indptr, shape)
+	
+def to_csr(A):
+	'''
+	CSRMatrix holding the nonzero entries of a dense A
+	'''
+	A = np.asarray(A, dtype=np.float64)
+	i, j = np.nonzero(A)
+	return _csr_from_triplets(i, j, A[i, j], A.shape)
+	
+def _adjacency(A):
+	'''
+	Neighbour lists of the symmetric pattern of A + A^T (no diagonal)
+	'''
+	i = np.concatenate([A.row_ids(), A.indices])
+	j = np.concatenate([A.indices, A.row_ids()])
+	keep = i != j
+	G = _csr_from_triplets(i[keep], j[keep], np.ones(np.count_nonzero(keep)), A.shape)
+	return [np.unique(G.indices[G.indptr[k]:G.indptr[k+1]]) for k in range(0, A.shape[0])]
+	
+def RCM(A):
+	'''
+	Reverse Cuthill-McKee ordering of a CSRMatrix
+	Breadth first search from a low degree node, visiting neighbours by
+	increasing degree, then reversed. Keeps the factor's fill close to the
+	diagonal. Returns perm so that the reordered matrix is A[perm][:, perm].
+	'''
+	adj = _adjacency(A)
+	n = len(adj)
+	degree = np.array([len(a) for a in adj])
+	visited = np.zeros(n, dtype=bool)
+	order = []
+	for start in np.argsort(degree, kind="stable"):	# one pass per connected component
+		if visited[start]:
+			continue
+		visited[start] = True
+		queue = [start]
+		head = 0
+		while head < len(queue):
+			v = queue[head]
+			head += 1
+			nbrs = adj[v][~visited[adj[v]]]
+			nbrs = nbrs[np.argsort(degree[nbrs], kind="stable")]
+			visited[nbrs] = True
+			queue.extend(nbrs.tolist())
+		order.extend(queue)
+	return np.array(order[::-1], dtype=np.int64)
+	
+def permute(A, perm):
+	'''
+	Symmetric permutation A[perm][:, perm] of a CSRMatrix
+	'''
+	iperm = np.empty_like(perm)
+	iperm[perm] = np.arange(len(perm))
+	return _csr_from_triplets(iperm[A.row_ids()], iperm[A.indices], A.data, A.shape)
+	
+class SparseSymbolic(object):
+	'''
+	Symbolic analysis of a sparse matrix: fill reducing ordering plus the
+	nonzero pattern of the factor, found from the elimination tree of the
+	reordered A + A^T. Only depends on the sparsity pattern, so it can be
+	reused for every matrix with the same pattern.
+	fill=False keeps only A's own pattern, which turns the factorizations on
+	top of it into the incomplete IC(0)/ILU(0) variants.
+	Column j of L has its rows in Li[Lp[j]:Lp[j+1]], diagonal first.
+	'''
+	def __init__(self, A, ordering="rcm", fill=True):
+		n = A.shape[0]
+		if A.shape[1] != n:
+			raise Exception ("Sparse factorization needs a square matrix")
+		if ordering == "rcm":
+			self.perm = RCM(A)
+		elif ordering is None:
+			self.perm = np.arange(n)
+		else:
+			raise Exception (f"Unknown ordering {ordering}")
+		adj = _adjacency(permute(A, self.perm))
+		cols = []	# below diagonal rows of each column of L
+		children = [[] for k in range(0, n)]
+		self.parent = np.full(n, -1, dtype=np.int64)
+		for j in range(0, n):
+			# column j fills in with the pattern of every child in the elimination tree
+			s = set(adj[j][adj[j] > j].tolist())
+			for c in children[j] if fill else []:
+				s.update(cols[c][1:].tolist())
+			cols.append(np.array(sorted(s), dtype=np.int64))
+			if len(cols[j]):
+				self.parent[j] = cols[j][0]
+				children[cols[j][0]].append(j)
+		self.Lp = np.zeros(n + 1, dtype=np.int64)
+		self.Lp[1:] = np.cumsum([len(c) + 1 for c in cols])
+		self.Li = np.zeros(self.Lp[-1], dtype=np.int64)
+		for j in range(0, n):
+			self.Li[self.Lp[j]] = j
+			self.Li[self.Lp[j]+1:self.Lp[j+1]] = cols[j]
+		# row structure: for row j, the columns k < j with L[j, k] != 0 and where that entry sits
+		self.rows = [[] for k in range(0, n)]
+		for k in range(0, n):
+			for p in range(self.Lp[k] + 1, self.Lp[k+1]):
+				self.rows[self.Li[p]].append((k, p))
+		self.n = n
+		
+def analyze(A, ordering="rcm", fill=True):
+	'''
+	Symbolic analysis step for the sparse LU and cholesky (see SparseSymbolic)
+	'''
+	return SparseSymbolic(A, ordering, fill)
+	
+class SparseFactor(object):
+	'''
+	Numeric sparse factorization on top of a SparseSymbolic pattern
+	Lx holds L column by column. For LU, Ux holds U row by row on the same
+	pattern (row k of U matches column k of L) and L has a unit diagonal.
+	'''
+	def __init__(self, A, symbolic=None, kind="lu"):
+		S = symbolic if symbolic is not None else analyze(A)
+		self.symbolic = S
+		self.kind = kind
+		B = permute(A, S.perm)
+		Bt = B.transpose()
+		n = S.n
+		Lp, Li = S.Lp, S.Li
+		self.Lx = np.zeros(len(Li), dtype=np.float64)
+		self.Ux = np.zeros(len(Li), dtype=np.float64) if kind == "lu" else None
+		wl = np.zeros(n, dtype=np.float64)
+		wu = np.zeros(n, dtype=np.float64)
+		for j in range(0, n):
+			pat = Li[Lp[j]:Lp[j+1]]
+			wl[pat] = 0
+			# column j of B, only the rows that end up in L
+			s, e = Bt.indptr[j], Bt.indptr[j+1]
+			r = Bt.indices[s:e]
+			wl[r[r >= j]] = Bt.data[s:e][r >= j]
+			if kind == "lu":
+				wu[pat] = 0
+				s, e = B.indptr[j], B.indptr[j+1]
+				r = B.indices[s:e]
+				wu[r[r >= j]] = B.data[s:e][r >= j]
+			for k, p in S.rows[j]:
+				seg = Li[p:Lp[k+1]]
+				if kind == "lu":
+					wu[seg] -= self.Lx[p] * self.Ux[p:Lp[k+1]]
+					wl[seg] -= self.Ux[p] * self.Lx[p:Lp[k+1]]
+				else:
+					wl[seg] -= self.Lx[p] * self.Lx[p:Lp[k+1]]
+			if kind == "lu":
+				if wu[j] == 0:
+					raise Exception ("Zero pivot in sparse LU")
+				self.Ux[Lp[j]:Lp[j+1]] = wu[pat]
+				self.Lx[Lp[j]] = 1
+				self.Lx[Lp[j]+1:Lp[j+1]] = wl[pat[1:]] * (1.0 / wu[j])
+			else:
+				if not wl[j] > 0:
+					raise NotPosDefError(S.perm[j])
+				d = np.sqrt(wl[j])
+				self.Lx[Lp[j]] = d
+				self.Lx[Lp[j]+1:Lp[j+1]] = wl[pat[1:]] * (1.0 / d)
+				
+	def solve(self, b):
+		'''
+		Solves Ax = b with the sparse factors
+		'''
+		S = self.symbolic
+		Lp, Li = S.Lp, S.Li
+		y = np.array(b, dtype=np.float64)
+		if y.ndim == 1:
+			y = y.reshape(-1, 1)
+		y = y[S.perm]
+		for j in range(0, S.n):	# forward sweep down the columns of L
+			s, e = Lp[j], Lp[j+1]
+			y[j] *= 1.0 / self.Lx[s]
+			y[Li[s+1:e]] -= np.multiply.outer(self.Lx[s+1:e], y[j])
+		R = self.Ux if self.kind == "lu" else self.Lx	# rows of U, or of L^T
+		for j in range(S.n - 1, -1, -1):
+			s, e = Lp[j], Lp[j+1]
+			y[j] = (y[j] - np.dot(R[s+1:e], y[Li[s+1:e]])) * (1.0 / R[s])
+		x = np.zeros_like(y)
+		x[S.perm] = y
+		return x
@@ -0,0 +1,155 @@
+# Cowboy Linear Algebra python library - triangular solves and packed storage
+# By: Nick the Space Cowboy
+
+import numpy as np
+from .backend import jit_kernel
+
+class PackedMatrix(object):
+	'''
+	Lower triangle of an n x n matrix packed column by column into
+	n(n+1)/2 contiguous doubles (LAPACK "L" packed layout)
+	Read as rows instead, the same data is the upper triangle of the transpose,
+	so one PackedMatrix serves both L and L^T in the triangular solvers.
+	'''
+	def __init__(self, data, n):
+		self.data = data
+		self.n = n
+		
+	def offset(self, j):
+		'''
+		Index of A[j, j] in data
+		'''
+		return j * self.n - (j * (j - 1)) // 2
+		
+	def col(self, j):
+		'''
+		View of A[j:, j]
+		'''
+		s = self.offset(j)
+		return self.data[s:s + self.n - j]
+		
+	def panel(self, k0, k1, r0):
+		'''
+		Dense copy of rows r0: of columns k0:k1, zero above the diagonal
+		'''
+		P = np.zeros([self.n - r0, k1 - k0], dtype=np.float64)
+		for t, j in enumerate(range(k0, k1)):
+			r = max(r0, j)
+			P[r - r0:, t] = self.col(j)[r - j:]
+		return P
+		
+	def set_panel(self, k0, k1, r0, P):
+		'''
+		Writes the on/below diagonal part of a dense panel back into data
+		'''
+		for t, j in enumerate(range(k0, k1)):
+			r = max(r0, j)
+			self.col(j)[r - j:] = P[r - r0:, t]
+			
+	def copy(self):
+		return PackedMatrix(self.data.copy(), self.n)
+
+def pack(A):
+	'''
+	Packs the lower triangle of A (the whole of a symmetric A) into a PackedMatrix
+	'''
+	n = len(A)
+	P = PackedMatrix(np.empty(n * (n + 1) // 2, dtype=np.float64), n)
+	for j in range(0, n):
+		P.col(j)[:] = A[j:, j]
+	return P
+	
+def unpack(P, symmetric=False):
+	'''
+	Dense lower triangular array from a PackedMatrix
+	symmetric=True mirrors it into the upper triangle as well
+	'''
+	A = np.zeros([P.n, P.n], dtype=np.float64)
+	for j in range(0, P.n):
+		A[j:, j] = P.col(j)
+		if symmetric:
+			A[j, j:] = P.col(j)
+	return A
+	
+def _packed_tri_solve(P, c, lower=False, unit_diagonal=False):
+	'''
+	Triangular solve with the lower triangle L held in P (or with L^T when
+	lower=False). Both walk the contiguous packed columns.
+	'''
+	x = np.array(c, dtype=np.float64)
+	if x.ndim == 1:
+		x = x.reshape(-1, 1)
+	n = P.n
+	if lower:
+		for j in range(0, n):	# column oriented: eliminate x_j from the rows below
+			col = P.col(j)
+			if not unit_diagonal:
+				x[j] *= 1.0 / col[0]
+			x[j+1:] -= np.multiply.outer(col[1:], x[j])
+	else:
+		for j in range(n - 1, -1, -1):	# row j of L^T is column j of L
+			col = P.col(j)
+			x[j] -= np.dot(col[1:], x[j+1:])
+			if not unit_diagonal:
+				x[j] *= 1.0 / col[0]
+	return x
+
+def _tri_solve(T, c, lower=False, unit_diagonal=False, order=None):
+	'''
+	triangular solve engine shared by back_sub and forward_sub
+	Works a row at a time with dot products and takes one reciprocal per pivot.
+	order="F" (or a Fortran ordered T) sweeps column by column instead, which
+	reads T down contiguous columns.
+	'''
+	m = len(T) # row dimension of the T matrix
+	n = len(T[0]) # column dimension of the T matrix
+	if m > n:
+		raise Exception ("More rows than columns (Use a different method)")
+	b = np.array(c, dtype=np.float64)
+	if b.ndim == 1:
+		b = b.reshape(-1, 1)
+	kernel = None if lower or unit_diagonal else jit_kernel("back_sub")
+	if kernel is not None and order is None:
+		return kernel(np.ascontiguousarray(T, dtype=np.float64), b)
+	x = np.zeros([n, b.shape[1]], dtype=np.float64)
+	if unit_diagonal:
+		rdiag = np.ones(m, dtype=np.float64)
+	else:
+		rdiag = 1.0 / np.diagonal(T)[:m]	# one reciprocal per pivot
+	if order is None:
+		order = "F" if np.isfortran(T) else "C"
+	rows = range(0, m) if lower else range(m - 1, -1, -1)
+	if order == "C":
+		for i in rows:	# row oriented: x_i = (b_i - T_i . x) / t_ii
+			if lower:
+				x[i] = (b[i] - np.dot(T[i, :i], x[:i])) * rdiag[i]
+			else:
+				x[i] = (b[i] - np.dot(T[i, i+1:m], x[i+1:m])) * rdiag[i]
+	else:
+		x[:m] = b[:m]
+		for j in rows:	# column oriented: eliminate x_j from the remaining rows
+			x[j] *= rdiag[j]
+			if lower:
+				x[j+1:m] -= np.outer(T[j+1:m, j], x[j])
+			else:
+				x[:j] -= np.outer(T[:j, j], x[j])
+	return x
+
+def back_sub(Utri, c, unit_diagonal=False, order=None):
+	'''
+	back substitution alogrithm for solving upper triangular system
+	A PackedMatrix Utri is taken as the transpose of the lower triangle it holds
+	unit_diagonal=True skips the division for an implied unit diagonal
+	'''
+	if isinstance(Utri, PackedMatrix):
+		return _packed_tri_solve(Utri, c, lower=False, unit_diagonal=unit_diagonal)
+	return _tri_solve(Utri, c, lower=False, unit_diagonal=unit_diagonal, order=order)
+
+def forward_sub(Ltri, c, unit_diagonal=False, order=None):
+	'''
+	forward substitution alogrithm for solving lower triangular system
+	unit_diagonal=True skips the division for an implied unit diagonal (LU's L)
+	'''
+	if isinstance(Ltri, PackedMatrix):
+		return _packed_tri_solve(Ltri, c, lower=True, unit_diagonal=unit_diagonal)
+	return _tri_solve(Ltri, c, lower=True, unit_diagonal=unit_diagonal, order=order)